@@ -11,6 +11,7 @@
 
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/string.h>
+#include <nanobind/stl/tuple.h>
 
 #include <sstream>
 
@@ -196,6 +197,10 @@ NB_MODULE(models, m) {
         .def_prop_ro("tail", &PoseBuffer::tail, "Oldest pose")
         .def("push", &PoseBuffer::push, "Get last pose pushed in the buffer", "x"_a, "y"_a, "angle"_a)
         .def_prop_ro("last", &PoseBuffer::last, "Get last pose pushed in the buffer")
+        .def("last_xyo", [](const PoseBuffer &buffer) {
+            Pose pose = buffer.last();
+            return std::make_tuple(pose.x(), pose.y(), pose.angle());
+        }, "Get (x, y, angle) of the last pose pushed in the buffer")
         .def("get", &PoseBuffer::get, "Get the N-th position from head (0 is the most recent)", "n"_a)
         .def("__repr__", [](const PoseBuffer &buffer) {
             std::ostringstream oss;
@@ -3,9 +3,11 @@
 // General Public License v2.1. See the file LICENSE in the top level directory.
 
 #include "utils/LidarDataConverter.hpp"
+#include "utils/fnv1a.hpp"
 
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/string.h>
+#include <nanobind/stl/string_view.h>
 
 namespace nb = nanobind;
 using namespace nb::literals;
@@ -17,6 +19,8 @@ namespace utils {
 NB_MODULE(utils, m) {
     auto shm_module = nb::module_::import_("cogip.cpp.libraries.shared_memory");
 
+    m.def("fnv1a_hash", &fnv1a_hash, "Compute FNV-1a 32-bit hash of a string", "string"_a);
+
     nb::class_<LidarDataConverter>(m, "LidarDataConverter")
          .def(nb::init<const std::string &>(), "Constructor for LidarDataConverter", "name"_a)
          .def("start", &LidarDataConverter::start, "Start the LidarDataConverter thread")
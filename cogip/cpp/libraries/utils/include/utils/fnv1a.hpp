@@ -0,0 +1,31 @@
+// Copyright (C) 2025 COGIP Robotics association <cogip35@gmail.com>
+// This file is subject to the terms and conditions of the GNU Lesser
+// General Public License v2.1. See the file LICENSE in the top level directory.
+
+#pragma once
+
+#include <cstdint>
+#include <string_view>
+
+namespace cogip {
+
+namespace utils {
+
+/// Compute FNV-1a 32-bit hash of a string.
+/// Matches the firmware's hash implementation used for parameter and telemetry keys.
+constexpr uint32_t fnv1a_hash(std::string_view str)
+{
+    constexpr uint32_t fnv_offset_basis = 0x811C9DC5;
+    constexpr uint32_t fnv_prime = 0x01000193;
+
+    uint32_t hash = fnv_offset_basis;
+    for (unsigned char byte : str) {
+        hash ^= byte;
+        hash *= fnv_prime;
+    }
+    return hash;
+}
+
+} // namespace utils
+
+} // namespace cogip
@@ -1,35 +1,91 @@
-from .firmware_parameter import (  # noqa
-    FirmwareParameter,
-    FirmwareParameterNotFound,
-    FirmwareParametersGroup,
-    FirmwareParameterValidationFailed,
-)
-from .firmware_telemetry import (  # noqa
-    TelemetryData,
-    TelemetryDict,
-    TelemetryValue,
-)
-from .models import (  # noqa
-    CameraExtrinsicParameters,
-    DynObstacle,
-    DynObstacleList,
-    DynObstacleRect,
-    DynRoundObstacle,
-    EmergencyStopStatus,
-    MenuEntry,
-    Obstacle,
-    PathPose,
-    Pose,
-    PowerRailsStatus,
-    PowerSourceStatus,
-    RobotState,
-    ShellMenu,
-    SpeedOrder,
-    Vertex,
-)
-from .odometry_calibration import (  # noqa
-    CalibrationResult,
-    CalibrationState,
-    EncoderDeltas,
-    OdometryParameters,
-)
+"""
+Models are loaded on first access to avoid building all Pydantic model classes
+when a tool only needs a few of them (PEP 562).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .firmware_parameter import (  # noqa
+        FirmwareParameter,
+        FirmwareParameterNotFound,
+        FirmwareParametersGroup,
+        FirmwareParameterValidationFailed,
+    )
+    from .firmware_telemetry import (  # noqa
+        TelemetryData,
+        TelemetryDict,
+        TelemetryValue,
+    )
+    from .models import (  # noqa
+        CameraExtrinsicParameters,
+        DynObstacle,
+        DynObstacleList,
+        DynObstacleRect,
+        DynRoundObstacle,
+        EmergencyStopStatus,
+        MenuEntry,
+        Obstacle,
+        PathPose,
+        Pose,
+        PowerRailsStatus,
+        PowerSourceStatus,
+        RobotState,
+        ShellMenu,
+        SpeedOrder,
+        Vertex,
+    )
+    from .odometry_calibration import (  # noqa
+        CalibrationResult,
+        CalibrationState,
+        EncoderDeltas,
+        OdometryParameters,
+    )
+
+_lazy_exports: dict[str, str] = {
+    "FirmwareParameter": "firmware_parameter",
+    "FirmwareParameterNotFound": "firmware_parameter",
+    "FirmwareParametersGroup": "firmware_parameter",
+    "FirmwareParameterValidationFailed": "firmware_parameter",
+    "TelemetryData": "firmware_telemetry",
+    "TelemetryDict": "firmware_telemetry",
+    "TelemetryValue": "firmware_telemetry",
+    "CameraExtrinsicParameters": "models",
+    "DynObstacle": "models",
+    "DynObstacleList": "models",
+    "DynObstacleRect": "models",
+    "DynRoundObstacle": "models",
+    "EmergencyStopStatus": "models",
+    "MenuEntry": "models",
+    "Obstacle": "models",
+    "PathPose": "models",
+    "Pose": "models",
+    "PowerRailsStatus": "models",
+    "PowerSourceStatus": "models",
+    "RobotState": "models",
+    "ShellMenu": "models",
+    "SpeedOrder": "models",
+    "Vertex": "models",
+    "CalibrationResult": "odometry_calibration",
+    "CalibrationState": "odometry_calibration",
+    "EncoderDeltas": "odometry_calibration",
+    "OdometryParameters": "odometry_calibration",
+}
+
+__all__ = list(_lazy_exports)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _lazy_exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache the symbol so next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
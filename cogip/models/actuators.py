@@ -3,11 +3,16 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
-from cogip.protobuf import PB_PositionalActuatorCommand
+from cogip.protobuf import PB_BoolSensor, PB_PositionalActuator, PB_PositionalActuatorCommand
 
 # Actuators common definitions
 
 
+def enum_lookup(enum: type[IntEnum]) -> dict[str | int, IntEnum]:
+    """Build a dict mapping both names and values of an enum to its members"""
+    return {**{member.value: member for member in enum}, **enum.__members__}
+
+
 class ActuatorsKindEnum(IntEnum):
     """Enum defining actuators kind"""
 
@@ -16,6 +21,9 @@ class ActuatorsKindEnum(IntEnum):
     bool_sensor = 2
 
 
+actuators_kind_lookup = enum_lookup(ActuatorsKindEnum)
+
+
 class ActuatorBase(BaseModel):
     """Base model for actuators"""
 
@@ -36,6 +44,9 @@ class PositionalActuatorEnum(IntEnum):
     BACK_LIFT = 1
 
 
+positional_actuator_lookup = enum_lookup(PositionalActuatorEnum)
+
+
 class PositionalActuatorCommand(BaseModel):
     """Model defining a command to send to positional actuators"""
 
@@ -67,12 +78,9 @@ class PositionalActuatorCommand(BaseModel):
     @classmethod
     def validate_kind(cls, v: str) -> ActuatorsKindEnum:
         try:
-            value = ActuatorsKindEnum[v]
-        except KeyError:
-            try:
-                value = ActuatorsKindEnum(v)
-            except Exception:
-                raise ValueError("Not a ActuatorsKindEnum")
+            value = actuators_kind_lookup[v]
+        except (KeyError, TypeError):
+            raise ValueError("Not a ActuatorsKindEnum")
         if value != ActuatorsKindEnum.positional_actuator:
             raise ValueError("Not ActuatorsKindEnum.positional_actuator value")
         return value
@@ -81,12 +89,9 @@ class PositionalActuatorCommand(BaseModel):
     @classmethod
     def validate_id(cls, v: str) -> PositionalActuatorEnum:
         try:
-            return PositionalActuatorEnum[v]
-        except KeyError:
-            try:
-                return PositionalActuatorEnum(v)
-            except Exception:
-                raise ValueError("Not a PositionalActuatorEnum")
+            return positional_actuator_lookup[v]
+        except (KeyError, TypeError):
+            raise ValueError("Not a PositionalActuatorEnum")
 
     def pb_copy(self, message: PB_PositionalActuatorCommand) -> None:
         """Copy values to Protobuf message"""
@@ -115,6 +120,15 @@ class PositionalActuatorState(BaseModel):
     position: int
     state: PositionalActuatorStateEnum
 
+    @classmethod
+    def from_pb(cls, message: PB_PositionalActuator) -> "PositionalActuatorState":
+        """Build from a Protobuf message received from the firmware, skipping validation"""
+        return cls.model_construct(
+            id=PositionalActuatorEnum(message.id),
+            position=message.position,
+            state=PositionalActuatorStateEnum(message.state),
+        )
+
 
 # Bool sensor related definitions
 
@@ -150,6 +164,11 @@ class BoolSensorState(BaseModel):
     id: BoolSensorEnum
     state: bool
 
+    @classmethod
+    def from_pb(cls, message: PB_BoolSensor) -> "BoolSensorState":
+        """Build from a Protobuf message received from the firmware, skipping validation"""
+        return cls.model_construct(id=BoolSensorEnum(message.id), state=message.state)
+
 
 ActuatorState = Annotated[PositionalActuatorState | BoolSensorState, Field(discriminator="kind")]
 ActuatorCommand = PositionalActuatorCommand
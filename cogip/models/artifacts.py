@@ -1,8 +1,39 @@
 from enum import IntEnum, auto
+from typing import NamedTuple
+
+from pydantic import ConfigDict
 
 from .models import Pose, Vertex
 
 
+class ArtifactPosition(NamedTuple):
+    """
+    Immutable default position of an artifact for blue camp.
+
+    Attributes:
+        x: X position
+        y: Y position
+        angle: Orientation in degrees, None if the artifact can be approached from any side
+        training: Whether the artifact is present on the training table
+    """
+
+    x: float
+    y: float
+    angle: float | None
+    training: bool
+
+
+def mirror_positions(positions: dict[IntEnum, ArtifactPosition]) -> dict[IntEnum, ArtifactPosition]:
+    """
+    Return positions mirrored for the yellow camp.
+    Given the table orientation and axes, only Y and the angle change.
+    """
+    return {
+        artifact_id: ArtifactPosition(x, -y, None if angle is None else -angle, training)
+        for artifact_id, (x, y, angle, training) in positions.items()
+    }
+
+
 class FixedObstacleID(IntEnum):
     """
     Enum to identify fixed obstacles.
@@ -17,8 +48,12 @@ class FixedObstacleID(IntEnum):
 class FixedObstacle(Vertex):
     """
     Model for fixed obstacles.
+    Fixed obstacles are never modified once created, so instances are frozen
+    and can be shared between game contexts.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: FixedObstacleID
     length: float
     width: float
@@ -54,17 +89,20 @@ class CollectionArea(Pose):
 
 
 # Default positions for blue camp (X, Y, Angle in degrees, training)
-collection_areas: dict[CollectionAreaID, tuple[float, float, float, bool]] = {
-    CollectionAreaID.LocalBottom: (-825, -400, 180, True),
-    CollectionAreaID.LocalBottomSide: (-600, -1325, -90, True),
-    CollectionAreaID.LocalTopSide: (200, -1325, -90.0, False),
-    CollectionAreaID.LocalCenter: (-200, -350, None, True),
-    CollectionAreaID.OppositeBottom: (-825, 400, 180, False),
-    CollectionAreaID.OppositeBottomSide: (-600, 1325, 90, False),
-    CollectionAreaID.OppositeTopSide: (200, 1325, 90, False),
-    CollectionAreaID.OppositeCenter: (-200, 350, None, False),
+collection_areas: dict[CollectionAreaID, ArtifactPosition] = {
+    CollectionAreaID.LocalBottom: ArtifactPosition(-825, -400, 180, True),
+    CollectionAreaID.LocalBottomSide: ArtifactPosition(-600, -1325, -90, True),
+    CollectionAreaID.LocalTopSide: ArtifactPosition(200, -1325, -90.0, False),
+    CollectionAreaID.LocalCenter: ArtifactPosition(-200, -350, None, True),
+    CollectionAreaID.OppositeBottom: ArtifactPosition(-825, 400, 180, False),
+    CollectionAreaID.OppositeBottomSide: ArtifactPosition(-600, 1325, 90, False),
+    CollectionAreaID.OppositeTopSide: ArtifactPosition(200, 1325, 90, False),
+    CollectionAreaID.OppositeCenter: ArtifactPosition(-200, 350, None, False),
 }
 
+# Positions for yellow camp, mirrored once at import
+yellow_collection_areas: dict[CollectionAreaID, ArtifactPosition] = mirror_positions(collection_areas)
+
 
 class PantryID(IntEnum):
     """
@@ -98,16 +136,19 @@ class Pantry(Pose):
 
 
 # Default positions for blue camp (X, Y, Angle in degrees, training)
-pantries: dict[PantryID, tuple[float, float, float | None, bool]] = {
-    PantryID.LocalTop: (450, -250, 0, False),
-    PantryID.LocalSide: (-200, -1400, -90, False),
-    PantryID.LocalBottom: (-900, -800, 180, True),
-    PantryID.LocalCenter: (-200, -700, None, True),
-    PantryID.OppositeTop: (450, 250, 0, False),
-    PantryID.OppositeSide: (-200, 1400, 90, False),
-    PantryID.OppositeBottom: (-900, 800, 180, False),
-    PantryID.OppositeCenter: (-200, 700, None, False),
-    PantryID.MiddleCenter: (-200, 0, None, False),
-    PantryID.MiddleBottom: (-900, 0, 180, False),
-    PantryID.Nest: (800, -1250, 0, True),
+pantries: dict[PantryID, ArtifactPosition] = {
+    PantryID.LocalTop: ArtifactPosition(450, -250, 0, False),
+    PantryID.LocalSide: ArtifactPosition(-200, -1400, -90, False),
+    PantryID.LocalBottom: ArtifactPosition(-900, -800, 180, True),
+    PantryID.LocalCenter: ArtifactPosition(-200, -700, None, True),
+    PantryID.OppositeTop: ArtifactPosition(450, 250, 0, False),
+    PantryID.OppositeSide: ArtifactPosition(-200, 1400, 90, False),
+    PantryID.OppositeBottom: ArtifactPosition(-900, 800, 180, False),
+    PantryID.OppositeCenter: ArtifactPosition(-200, 700, None, False),
+    PantryID.MiddleCenter: ArtifactPosition(-200, 0, None, False),
+    PantryID.MiddleBottom: ArtifactPosition(-900, 0, 180, False),
+    PantryID.Nest: ArtifactPosition(800, -1250, 0, True),
 }
+
+# Positions for yellow camp, mirrored once at import
+yellow_pantries: dict[PantryID, ArtifactPosition] = mirror_positions(pantries)
@@ -1,10 +1,12 @@
-from typing import Annotated, Literal
+from collections.abc import Callable
+from typing import Annotated, Any, Literal
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     NonNegativeInt,
+    PrivateAttr,
     RootModel,
     Strict,
     StrictBool,
@@ -120,11 +122,19 @@ class FirmwareParameter(BaseModel):
 
     model_config = ConfigDict(validate_assignment=True)
 
-    name: str
-    value_obj: Annotated[FirmwareParameterValueType, Field(alias="value", discriminator="type")]
+    name: Annotated[str, Field(frozen=True)]
+    value_obj: Annotated[FirmwareParameterValueType, Field(alias="value", discriminator="type", frozen=True)]
+    _name_hash: int = PrivateAttr()
+    _pb_field: str = PrivateAttr()
+
+    def model_post_init(self, __context) -> None:
+        """Compute the name hash and the Protobuf value field name once, they cannot change afterwards."""
+        super().model_post_init(__context)
+        self._name_hash = fnv1a_hash(self.name)
+        self._pb_field = f"{self.value_obj.type}_value"
 
     def __hash__(self):
-        return fnv1a_hash(self.name)
+        return self._name_hash
 
     @property
     def value(self) -> float | int | bool:
@@ -150,10 +160,16 @@ class FirmwareParameter(BaseModel):
 
     def pb_copy(self, message: PB_ParameterSetRequest | PB_ParameterGetRequest) -> None:
         """Copy values to Protobuf message"""
-        message.key_hash = hash(self)
+        message.key_hash = self._name_hash
+        _pb_copy_handlers[type(message)](self, message)
 
-        if isinstance(message, PB_ParameterSetRequest):
-            setattr(message.value, f"{self.value_obj.type}_value", self.value_obj.content)
+    def _pb_copy_set_request(self, message: PB_ParameterSetRequest) -> None:
+        """Copy the content value to a ParameterSetRequest message."""
+        setattr(message.value, self._pb_field, self.value_obj.content)
+
+    def _pb_copy_get_request(self, message: PB_ParameterGetRequest) -> None:
+        """A ParameterGetRequest only carries the key hash."""
+        pass
 
     def pb_read(self, message: PB_ParameterSetResponse | PB_ParameterGetResponse) -> None:
         """Read values from Protobuf message and update firmware parameter content.
@@ -169,30 +185,48 @@ class FirmwareParameter(BaseModel):
         """
 
         # Verify that the name matches
-        if message.key_hash != hash(self):
-            raise ValueError(f"Key hash mismatch: expected '{hash(self)}', got '{message.key_hash}'")
+        if message.key_hash != self._name_hash:
+            raise ValueError(f"Key hash mismatch: expected '{self._name_hash}', got '{message.key_hash}'")
+
+        _pb_read_handlers[type(message)](self, message)
 
-        if isinstance(message, PB_ParameterSetResponse):
-            # Check status and raise appropriate exceptions
-            match message.status:
-                case PB_ParameterStatus.VALIDATION_FAILED:
-                    raise FirmwareParameterValidationFailed(f"Firmware parameter '{self.name}' validation failed")
-                case PB_ParameterStatus.NOT_FOUND:
-                    raise FirmwareParameterNotFound(f"Firmware parameter '{self.name}' not found in registry")
-                case PB_ParameterStatus.SUCCESS:
-                    pass  # Operation succeeded, nothing to do
-        elif isinstance(message, PB_ParameterGetResponse):
-            # Get the name of the field defined in the oneof
-            which_field = message.value.WhichOneof("value")
+    def _pb_read_set_response(self, message: PB_ParameterSetResponse) -> None:
+        """Check the status of a ParameterSetResponse and raise appropriate exceptions."""
+        if (exception := _pb_status_exceptions.get(message.status)) is not None:
+            raise exception(self.name)
 
-            if which_field is None:
-                raise ValueError("No value set in ParameterGetResponse, firmware parameter not found")
+    def _pb_read_get_response(self, message: PB_ParameterGetResponse) -> None:
+        """Update the content value from a ParameterGetResponse."""
+        # Get the name of the field defined in the oneof
+        which_field = message.value.WhichOneof("value")
 
-            # Get the value of the active field
-            content = getattr(message.value, which_field)
+        if which_field is None:
+            raise ValueError("No value set in ParameterGetResponse, firmware parameter not found")
 
-            # Update the firmware parameter content
-            self.value_obj.content = content
+        # Update the firmware parameter content with the value of the active field
+        self.value_obj.content = getattr(message.value, which_field)
+
+
+# Protobuf message handlers, dispatched on the exact message type
+_pb_copy_handlers: dict[type, Callable[[FirmwareParameter, Any], None]] = {
+    PB_ParameterSetRequest: FirmwareParameter._pb_copy_set_request,
+    PB_ParameterGetRequest: FirmwareParameter._pb_copy_get_request,
+}
+
+_pb_read_handlers: dict[type, Callable[[FirmwareParameter, Any], None]] = {
+    PB_ParameterSetResponse: FirmwareParameter._pb_read_set_response,
+    PB_ParameterGetResponse: FirmwareParameter._pb_read_get_response,
+}
+
+# Exceptions raised for failed ParameterSetResponse status, built from the parameter name
+_pb_status_exceptions: dict[int, Callable[[str], Exception]] = {
+    PB_ParameterStatus.VALIDATION_FAILED: lambda name: FirmwareParameterValidationFailed(
+        f"Firmware parameter '{name}' validation failed"
+    ),
+    PB_ParameterStatus.NOT_FOUND: lambda name: FirmwareParameterNotFound(
+        f"Firmware parameter '{name}' not found in registry"
+    ),
+}
 
 
 class FirmwareParametersGroup(RootModel):
@@ -205,15 +239,12 @@ class FirmwareParametersGroup(RootModel):
     """
 
     root: Annotated[list[FirmwareParameter], Field(default_factory=list)]
+    _params: dict[str, FirmwareParameter] = PrivateAttr(default_factory=dict)
 
     def model_post_init(self, __context) -> None:
-        """Build index after initialization."""
+        """Store firmware parameters by name after initialization."""
         super().model_post_init(__context)
-        self._rebuild_index()
-
-    def _rebuild_index(self) -> None:
-        """Rebuild the internal index for firmware parameter name lookup."""
-        self._index: dict[str, int] = {param.name: idx for idx, param in enumerate(self.root)}
+        self._params = {param.name: param for param in self.root}
 
     def get(self, name: str) -> FirmwareParameter:
         """Get a firmware parameter by its name.
@@ -227,9 +258,10 @@ class FirmwareParametersGroup(RootModel):
         Raises:
             KeyError: If the firmware parameter name is not found
         """
-        if name not in self._index:
-            raise KeyError(f"Firmware parameter '{name}' not found")
-        return self.root[self._index[name]]
+        try:
+            return self._params[name]
+        except KeyError:
+            raise KeyError(f"Firmware parameter '{name}' not found") from None
 
     def __contains__(self, name: str) -> bool:
         """Check if a firmware parameter name exists in the list.
@@ -240,7 +272,7 @@ class FirmwareParametersGroup(RootModel):
         Returns:
             True if the firmware parameter exists, False otherwise
         """
-        return name in self._index
+        return name in self._params
 
     def __getitem__(self, name: str) -> float | int | bool:
         """Get a firmware parameter's value using bracket notation.
@@ -270,8 +302,8 @@ class FirmwareParametersGroup(RootModel):
 
     def __len__(self) -> int:
         """Return the number of firmware parameters in the list."""
-        return len(self.root)
+        return len(self._params)
 
     def __iter__(self):
         """Iterate over all firmware parameters."""
-        return iter(self.root)
+        return iter(self._params.values())
@@ -5,6 +5,8 @@ This module provides models for parsing generic telemetry data received
 from the robot's MCU firmware via Protobuf messages using FNV-1a key hashes.
 """
 
+from operator import attrgetter
+
 from pydantic import BaseModel, ConfigDict
 
 from cogip.protobuf import PB_TelemetryData
@@ -13,6 +15,11 @@ from cogip.utils.fnv1a import fnv1a_hash
 # Discriminated union of all firmware telemetry value types
 TelemetryValue = float | int
 
+# Accessors of the PB_TelemetryData value oneof fields, by field name
+_value_getters: dict[str, attrgetter] = {
+    field.name: attrgetter(field.name) for field in PB_TelemetryData.DESCRIPTOR.oneofs_by_name["value"].fields
+}
+
 
 class TelemetryData(BaseModel):
     """
@@ -24,7 +31,7 @@ class TelemetryData(BaseModel):
         value: The telemetry value (float or int depending on type).
     """
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     key_hash: int
     timestamp_ms: int
@@ -49,9 +56,10 @@ class TelemetryData(BaseModel):
         if which_value is None:
             value: TelemetryValue = 0
         else:
-            value = getattr(message, which_value)
+            value = _value_getters[which_value](message)
 
-        return cls(key_hash=key_hash, timestamp_ms=timestamp_ms, value=value)
+        # Fields are already typed by the protobuf message, skip validation
+        return cls.model_construct(key_hash=key_hash, timestamp_ms=timestamp_ms, value=value)
 
 
 class TelemetryDict:
@@ -63,6 +71,8 @@ class TelemetryDict:
 
     def __init__(self):
         self._data: dict[int, TelemetryData] = {}
+        # Latest values by key hash, for the common case where only the value is needed
+        self._values: dict[int, TelemetryValue] = {}
 
     def update(self, data: TelemetryData) -> None:
         """
@@ -72,6 +82,7 @@ class TelemetryDict:
             data: The telemetry data point to store.
         """
         self._data[data.key_hash] = data
+        self._values[data.key_hash] = data.value
 
     def get_model(self, key: str) -> TelemetryData:
         """
@@ -88,6 +99,23 @@ class TelemetryDict:
         """
         return self._data[fnv1a_hash(key)]
 
+    def get_by_hash(self, key_hash: int) -> TelemetryData:
+        """
+        Get telemetry data model by key hash.
+
+        Fast path for callers that already know the FNV-1a hash of the key.
+
+        Args:
+            key_hash: The FNV-1a hash of the telemetry key.
+
+        Returns:
+            TelemetryData for the key hash.
+
+        Raises:
+            KeyError: If the key hash is not found in the store.
+        """
+        return self._data[key_hash]
+
     def __getitem__(self, key: str) -> TelemetryValue:
         """
         Get telemetry value by key name. Raises KeyError if not found.
@@ -101,7 +129,20 @@ class TelemetryDict:
         Raises:
             KeyError: If the key is not found in the store.
         """
-        return self._data[fnv1a_hash(key)].value
+        return self._values[fnv1a_hash(key)]
+
+    def get(self, key: str, default: TelemetryValue | None = None) -> TelemetryValue | None:
+        """
+        Get telemetry value by key name, with a single lookup.
+
+        Args:
+            key: The telemetry key name to look up.
+            default: Value returned if the key is not found.
+
+        Returns:
+            The telemetry value for the key, or default if not found.
+        """
+        return self._values.get(fnv1a_hash(key), default)
 
     def __contains__(self, key: str) -> bool:
         """
@@ -8,6 +8,7 @@ an exception being raised if impossible.
 """
 
 import math
+from functools import cache
 
 import numpy as np
 from numpy.typing import ArrayLike
@@ -95,6 +96,14 @@ class Pose(Vertex):
 
     O: float | None = 0.0  # noqa
 
+    @classmethod
+    def make(cls, x: float, y: float, O: float | None = 0.0, /):  # noqa
+        """
+        Create a pose from trusted float values, skipping validation.
+        Intended for hot paths where values come from shared memory or other models.
+        """
+        return cls.model_construct(x=x, y=y, O=O)
+
 
 class Speed(BaseModel):
     """
@@ -164,7 +173,7 @@ class PathPose(Pose):
 
     @property
     def pose(self) -> Pose:
-        return Pose(**self.model_dump())
+        return Pose.model_construct(x=self.x, y=self.y, z=self.z, O=self.O)
 
     def copy_pb(self, pb_path_pose: PB_PathPose) -> None:
         """
@@ -173,9 +182,10 @@ class PathPose(Pose):
         Arguments:
             pb_path_pose: Protobuf message to fill
         """
-        pb_path_pose.pose.x = int(self.x)
-        pb_path_pose.pose.y = int(self.y)
-        pb_path_pose.pose.O = int(self.O)  # noqa
+        pb_pose = pb_path_pose.pose
+        pb_pose.x = int(self.x)
+        pb_pose.y = int(self.y)
+        pb_pose.O = int(self.O)  # noqa
         pb_path_pose.max_speed_ratio_linear = self.max_speed_linear
         pb_path_pose.max_speed_ratio_angular = self.max_speed_angular
         pb_path_pose.motion_direction = self.motion_direction.value
@@ -216,22 +226,23 @@ class PathPose(Pose):
         Returns:
             A PathPose instance with the data from the SharedPoseOrder.
         """
-        path_pose = cls(
-            x=shared_pose.x,
-            y=shared_pose.y,
-            O=shared_pose.angle,  # noqa
-        )
+        # Values come from typed shared memory structures, skip validation
         if isinstance(shared_pose, SharedPoseOrder):
-            path_pose.max_speed_linear = shared_pose.max_speed_linear
-            path_pose.max_speed_angular = shared_pose.max_speed_angular
-            path_pose.motion_direction = shared_pose.motion_direction
-            path_pose.bypass_anti_blocking = shared_pose.bypass_anti_blocking
-            path_pose.timeout_ms = shared_pose.timeout_ms
-            path_pose.bypass_final_orientation = shared_pose.bypass_final_orientation
-            path_pose.is_intermediate = shared_pose.is_intermediate
-            path_pose.stop_before_distance = shared_pose.stop_before_distance
+            return cls.model_construct(
+                x=shared_pose.x,
+                y=shared_pose.y,
+                O=shared_pose.angle,
+                max_speed_linear=shared_pose.max_speed_linear,
+                max_speed_angular=shared_pose.max_speed_angular,
+                motion_direction=shared_pose.motion_direction,
+                bypass_anti_blocking=shared_pose.bypass_anti_blocking,
+                timeout_ms=shared_pose.timeout_ms,
+                bypass_final_orientation=shared_pose.bypass_final_orientation,
+                is_intermediate=shared_pose.is_intermediate,
+                stop_before_distance=shared_pose.stop_before_distance,
+            )
 
-        return path_pose
+        return cls.model_construct(x=shared_pose.x, y=shared_pose.y, O=shared_pose.angle)
 
 
 class DynObstacleRect(BaseModel):
@@ -277,7 +288,17 @@ class DynObstacleRect(BaseModel):
         """
         Hash function to allow this class to be used as a key in a dict.
         """
-        return hash((type(self),) + tuple(self.__root__))
+        return hash((type(self), self.x, self.y, self.angle, self.length_x, self.length_y))
+
+
+@cache
+def unit_circle_vertices(nb_vertices: int) -> tuple[tuple[float, float], ...]:
+    """
+    Return the (cos, sin) coordinates of a polygon inscribed in the unit circle,
+    in clockwise order. Computed once per number of vertices.
+    """
+    step = math.tau / nb_vertices
+    return tuple((math.cos(angle := step * i), math.sin(angle)) for i in reversed(range(nb_vertices)))
 
 
 class DynRoundObstacle(BaseModel):
@@ -300,19 +321,17 @@ class DynRoundObstacle(BaseModel):
         return (point.x - self.x) * (point.x - self.x) + (point.y - self.y) * (point.y - self.y) <= self.radius**2
 
     def create_bounding_box(self, bb_radius, nb_vertices):
+        # Coordinates are computed from validated fields, skip validation
         self.bb = [
-            Vertex(
-                x=self.x + bb_radius * math.cos(tmp := (i * 2 * math.pi) / nb_vertices),
-                y=self.y + bb_radius * math.sin(tmp),
-            )
-            for i in reversed(range(nb_vertices))
+            Vertex.model_construct(x=self.x + bb_radius * cos, y=self.y + bb_radius * sin)
+            for cos, sin in unit_circle_vertices(nb_vertices)
         ]
 
     def __hash__(self):
         """
         Hash function to allow this class to be used as a key in a dict.
         """
-        return hash((type(self),) + tuple(self.__root__))
+        return hash((type(self), self.x, self.y, self.radius))
 
 
 DynObstacle = DynRoundObstacle | DynObstacleRect
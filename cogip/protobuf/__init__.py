@@ -1,20 +1,95 @@
+"""
+Generated Protobuf modules are loaded on first access to avoid registering
+all message descriptors when a tool only needs a few of them (PEP 562).
+"""
+
+import importlib
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Generated Protobuf messages includes required messages
 # as if the current directory was the root of a package.
 # So add this directory to Python paths to allow the import.
 sys.path.insert(0, str(Path(__file__).parent.absolute()))
 
+# Prefer the native upb runtime, the pure Python one is much slower to build and serialize messages.
+# This must be set before google.protobuf is first imported, an explicit user choice is kept.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from google.protobuf.internal import api_implementation  # noqa: E402
+
+from cogip import logger  # noqa: E402
+
+if api_implementation.Type() not in ("upb", "cpp"):
+    logger.warning(
+        f"Protobuf uses the '{api_implementation.Type()}' implementation, "
+        "install a protobuf wheel with the upb extension for better performance"
+    )
+
+if TYPE_CHECKING:
+    from .PB_Actuators_pb2 import (  # noqa
+        PB_ActuatorCommand,
+        PB_ActuatorInit,
+        PB_ActuatorState,
+        PB_BoolSensor,
+        PB_PositionalActuator,
+        PB_PositionalActuatorCommand,
+    )
+    from .PB_Controller_pb2 import PB_Controller, PB_ControllerEnum  # noqa
+    from .PB_EmergencyStop_pb2 import PB_EmergencyStopStatus  # noqa
+    from .PB_ParameterCommands_pb2 import (  # noqa
+        PB_ParameterGetRequest,
+        PB_ParameterGetResponse,
+        PB_ParameterSetRequest,
+        PB_ParameterSetResponse,
+        PB_ParameterStatus,
+    )
+    from .PB_PathPose_pb2 import PB_PathPose  # noqa
+    from .PB_Pose_pb2 import PB_Pose  # noqa
+    from .PB_PowerSupply_pb2 import PB_PowerRailsStatus, PB_PowerSourceStatus  # noqa
+    from .PB_SpeedOrder_pb2 import PB_SpeedOrder  # noqa
+    from .PB_State_pb2 import PB_State  # noqa
+    from .PB_Telemetry_pb2 import PB_TelemetryData  # noqa
+
+_lazy_exports: dict[str, str] = {
+    "PB_Pose": "PB_Pose_pb2",
+    "PB_State": "PB_State_pb2",
+    "PB_PathPose": "PB_PathPose_pb2",
+    "PB_BoolSensor": "PB_Actuators_pb2",
+    "PB_PositionalActuator": "PB_Actuators_pb2",
+    "PB_PositionalActuatorCommand": "PB_Actuators_pb2",
+    "PB_ActuatorCommand": "PB_Actuators_pb2",
+    "PB_ActuatorInit": "PB_Actuators_pb2",
+    "PB_ActuatorState": "PB_Actuators_pb2",
+    "PB_ControllerEnum": "PB_Controller_pb2",
+    "PB_Controller": "PB_Controller_pb2",
+    "PB_ParameterGetRequest": "PB_ParameterCommands_pb2",
+    "PB_ParameterSetRequest": "PB_ParameterCommands_pb2",
+    "PB_ParameterGetResponse": "PB_ParameterCommands_pb2",
+    "PB_ParameterSetResponse": "PB_ParameterCommands_pb2",
+    "PB_ParameterStatus": "PB_ParameterCommands_pb2",
+    "PB_SpeedOrder": "PB_SpeedOrder_pb2",
+    "PB_TelemetryData": "PB_Telemetry_pb2",
+    "PB_PowerRailsStatus": "PB_PowerSupply_pb2",
+    "PB_PowerSourceStatus": "PB_PowerSupply_pb2",
+    "PB_EmergencyStopStatus": "PB_EmergencyStop_pb2",
+}
+
+__all__ = list(_lazy_exports)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _lazy_exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache the symbol so next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
 
-from .PB_Pose_pb2 import PB_Pose  # noqa
-from .PB_State_pb2 import PB_State  # noqa
-from .PB_PathPose_pb2 import PB_PathPose  # noqa
-from .PB_Actuators_pb2 import PB_PositionalActuatorCommand  # noqa
-from .PB_Actuators_pb2 import PB_ActuatorCommand, PB_ActuatorInit, PB_ActuatorState  # noqa
-from .PB_Controller_pb2 import PB_ControllerEnum, PB_Controller  # noqa
-from .PB_ParameterCommands_pb2 import PB_ParameterGetRequest, PB_ParameterSetRequest, PB_ParameterGetResponse, PB_ParameterSetResponse, PB_ParameterStatus  # noqa
-from .PB_SpeedOrder_pb2 import PB_SpeedOrder  # noqa
-from .PB_Telemetry_pb2 import PB_TelemetryData
-from .PB_PowerSupply_pb2 import PB_PowerRailsStatus, PB_PowerSourceStatus  # noqa
-from .PB_EmergencyStop_pb2 import PB_EmergencyStopStatus  # noqa
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
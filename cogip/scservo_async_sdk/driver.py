@@ -3,6 +3,7 @@ import logging
 
 import serial
 
+from .constants import Instruction
 from .protocol import Packet, PacketReader
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,9 @@ class SCServoDriver:
         self.serial: serial.Serial | None = None
         self.reader = PacketReader()
         self.response_future: asyncio.Future | None = None
+        # IDs of the servos expected to answer the pending request, and the responses received so far
+        self.response_ids: set[int] = set()
+        self.responses: dict[int, Packet] = {}
         self.lock = asyncio.Lock()
 
     async def __aenter__(self):
@@ -52,43 +56,71 @@ class SCServoDriver:
 
     def _data_received(self):
         try:
-            data = self.serial.read(self.serial.in_waiting)
+            in_waiting = self.serial.in_waiting
+            if not in_waiting:
+                return
+            data = self.serial.read(in_waiting)
         except Exception as e:
             logger.error(f"Serial read error: {e}")
             return
 
-        if data:
-            logger.debug(f"RX: {data.hex()}")
-            self.reader.feed(data)
-            # Try to parse packets
-            while True:
-                # We only process one packet at a time for simple request-response
-                # But multiple packets could arrive if we are slow or there's noise
-                pkt = self.reader.scan_packet()
-                if pkt:
-                    if self.response_future and not self.response_future.done():
-                        # We are waiting for a response
-                        # Check ID?
-                        # For now assume the first valid packet is the response
-                        self.response_future.set_result(pkt)
-                    else:
-                        # Unexpected packet
-                        pass
-                else:
+        if not data:
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RX: %s", data.hex())
+        self.reader.feed(data)
+
+        future = self.response_future
+        if not future or future.done():
+            # Unexpected or late data, nobody is waiting for it
+            self.reader.clear()
+            return
+
+        # Only one response is expected per addressed servo.
+        # Packets from other servos are stale responses to a previous request that timed out.
+        while pkt := self.reader.scan_packet():
+            if pkt.id in self.response_ids:
+                self.response_ids.discard(pkt.id)
+                self.responses[pkt.id] = pkt
+                if not self.response_ids:
+                    future.set_result(self.responses)
                     break
 
-    async def send_packet(self, packet: Packet, expect_response: bool = True, timeout: float = 0.5) -> Packet | None:
-        async with self.lock:
-            if not self.serial:
-                raise RuntimeError("Serial port not open")
+    def _write_packet(self, packet: Packet) -> None:
+        if not self.serial:
+            raise RuntimeError("Serial port not open")
 
-            # Clear input buffer to avoid reading old data
-            self.serial.reset_input_buffer()
-            self.reader = PacketReader()  # Clear our buffer too
+        # Drop bytes left by a previous request, stale bytes still in flight are filtered by servo ID
+        self.reader.clear()
 
-            data = packet.to_bytes()
-            logger.debug(f"TX: {data.hex()}")
-            self.serial.write(data)
+        data = packet.to_bytes()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX: %s", data.hex())
+        self.serial.write(data)
+
+    async def _wait_responses(self, ids: set[int], timeout: float) -> dict[int, Packet]:
+        """
+        Wait for one response from each servo in `ids`.
+        Returns the responses received before the timeout, by servo ID.
+        """
+        loop = asyncio.get_running_loop()
+        self.response_ids = ids
+        self.responses = {}
+        self.response_future = loop.create_future()
+
+        try:
+            await asyncio.wait_for(self.response_future, timeout)
+        except TimeoutError:
+            pass
+        finally:
+            self.response_future = None
+            self.response_ids = set()
+        return self.responses
+
+    async def send_packet(self, packet: Packet, expect_response: bool = True, timeout: float = 0.5) -> Packet | None:
+        async with self.lock:
+            self._write_packet(packet)
 
             if not expect_response:
                 return None
@@ -97,18 +129,18 @@ class SCServoDriver:
             if packet.id == 0xFE:
                 return None
 
-            loop = asyncio.get_running_loop()
-            self.response_future = loop.create_future()
-
-            try:
-                resp = await asyncio.wait_for(self.response_future, timeout)
-                # Optional: Validate Response ID matches Request ID
-                if resp.id != packet.id:
-                    # TODO: handle mismatch, maybe wait more?
-                    # For now return it, let upper layer decide
-                    pass
-                return resp
-            except TimeoutError:
-                return None
-            finally:
-                self.response_future = None
+            responses = await self._wait_responses({packet.id}, timeout)
+            return responses.get(packet.id)
+
+    async def sync_read(self, ids: list[int], address: int, length: int, timeout: float = 0.5) -> dict[int, Packet]:
+        """
+        Read the same register range from several servos in one bus transaction.
+        Each servo answers with its own status packet.
+        Returns the responses received before the timeout, by servo ID.
+        """
+        if not ids:
+            return {}
+        packet = Packet(0xFE, Instruction.SYNC_READ, [address, length, *ids])
+        async with self.lock:
+            self._write_packet(packet)
+            return await self._wait_responses(set(ids), timeout)
@@ -1,46 +1,46 @@
-def checksum(id: int, length: int, instruction: int, params: list[int]) -> int:
-    s = id + length + instruction + sum(params)
-    return (~s) & 0xFF
+import struct
+
+# Header: 0xFF 0xFF, id, length, instruction
+_header = struct.Struct("<BBBBB")
+
+
+def checksum(id: int, length: int, instruction: int, params: bytes) -> int:
+    return (~(id + length + instruction + sum(params))) & 0xFF
 
 
 class Packet:
-    def __init__(self, id: int, instruction: int, params: list[int] | None = None):
+    def __init__(self, id: int, instruction: int, params: bytes | list[int] | None = None):
         self.id = id
         self.instruction = instruction
-        self.params = params or []
+        self.params = bytes(params) if params else b""
 
     def to_bytes(self) -> bytes:
-        length = len(self.params) + 2  # instruction + checksum
-        cks = checksum(self.id, length, self.instruction, self.params)
-
-        data = [0xFF, 0xFF, self.id, length, self.instruction]
-        data.extend(self.params)
-        data.append(cks)
-        return bytes(data)
+        params = self.params
+        length = len(params) + 2  # instruction + checksum
+        cks = checksum(self.id, length, self.instruction, params)
+        return _header.pack(0xFF, 0xFF, self.id, length, self.instruction) + params + bytes((cks,))
 
     @staticmethod
-    def parse(data: bytes) -> tuple["Packet", int]:
+    def parse(data: bytes, offset: int = 0) -> tuple["Packet", int]:
         """
-        Parses a packet from bytes.
+        Parses a packet from bytes, starting at offset.
         Returns (Packet, consumed_bytes) if successful, or raises ValueError.
         """
-        if len(data) < 6:
+        if len(data) - offset < 6:
             raise ValueError("Data too short")
 
+        ff1, ff2, id, length, instruction = _header.unpack_from(data, offset)
+
         # Check header
-        if data[0] != 0xFF or data[1] != 0xFF:
+        if ff1 != 0xFF or ff2 != 0xFF:
             raise ValueError("Invalid Header")
 
-        id = data[2]
-        length = data[3]
-
-        if len(data) < 4 + length:
+        if len(data) - offset < 4 + length:
             raise ValueError("Incomplete packet")
 
-        instruction = data[4]
         params_len = length - 2
-        params = list(data[5 : 5 + params_len])
-        cks = data[4 + length - 1]
+        params = bytes(data[offset + 5 : offset + 5 + params_len])
+        cks = data[offset + 4 + length - 1]
 
         calc_cks = checksum(id, length, instruction, params)
         if cks != calc_cks:
@@ -51,94 +51,108 @@ class Packet:
 
 
 class PacketReader:
+    # Consumed bytes are only dropped from the buffer once they exceed this size
+    compact_threshold = 4096
+
     def __init__(self):
         self.buffer = bytearray()
+        self._head = 0
 
     def feed(self, data: bytes):
+        if self._head >= len(self.buffer):
+            self.buffer.clear()
+            self._head = 0
+        elif self._head > self.compact_threshold:
+            del self.buffer[: self._head]
+            self._head = 0
         self.buffer.extend(data)
 
-    def has_packet(self) -> bool:
-        # Search for header
-        idx = self.buffer.find(b"\xff\xff")
+    def clear(self):
+        """
+        Drop all pending bytes, the buffer is reused by the next feed.
+        """
+        self._head = len(self.buffer)
+
+    def _skip_to_header(self) -> int:
+        """
+        Move the head to the next header.
+        Returns its index, or -1 if no header is found.
+        """
+        idx = self.buffer.find(b"\xff\xff", self._head)
         if idx == -1:
             # keep last byte just in case it is FF
-            if self.buffer and self.buffer[-1] == 0xFF:
-                self.buffer = self.buffer[-1:]
+            if len(self.buffer) > self._head and self.buffer[-1] == 0xFF:
+                self._head = len(self.buffer) - 1
             else:
-                self.buffer.clear()
-            return False
+                self._head = len(self.buffer)
+            return -1
+
+        # skip garbage before header
+        self._head = idx
+        return idx
 
-        # trim garbage before header
-        if idx > 0:
-            self.buffer = self.buffer[idx:]
+    def has_packet(self) -> bool:
+        idx = self._skip_to_header()
+        if idx == -1:
+            return False
 
-        if len(self.buffer) < 4:
+        if len(self.buffer) - idx < 4:
             return False
 
-        length = self.buffer[3]
+        length = self.buffer[idx + 3]
         total_len = 4 + length
 
-        return len(self.buffer) >= total_len
+        return len(self.buffer) - idx >= total_len
 
     def read_packet(self) -> Packet:
-        idx = self.buffer.find(b"\xff\xff")
+        # Assumption: has_packet() was called and returned True,
+        # but for robustness, we re-parse.
+        idx = self._skip_to_header()
         if idx == -1:
             return None
 
-        # Assumption: has_packet() was called and returned True,
-        # so we have enough data starting at idx.
-        # But for robustness, we re-parse.
-
-        # trim
-        self.buffer = self.buffer[idx:]
-
-        if len(self.buffer) < 4:
+        if len(self.buffer) - idx < 4:
             return None
 
-        length = self.buffer[3]
+        length = self.buffer[idx + 3]
         total_len = 4 + length
 
-        if len(self.buffer) < total_len:
+        if len(self.buffer) - idx < total_len:
             return None
 
-        packet_data = self.buffer[:total_len]
         try:
-            pkt, _ = Packet.parse(packet_data)
-            self.buffer = self.buffer[total_len:]
+            pkt, _ = Packet.parse(self.buffer, idx)
+            self._head = idx + total_len
             return pkt
         except ValueError:
-            # Corrupt packet, remove header and try again from next byte
-            # Ideally we should remove only the first FF to see if next byte starts a header
-            self.buffer = self.buffer[1:]
-            # Recursion or return None and let loop handle it
+            # Corrupt packet, skip the first FF and search again from next byte
+            self._head = idx + 1
             return self.scan_packet()
 
     def scan_packet(self) -> Packet:
+        buffer = self.buffer
         while True:
-            idx = self.buffer.find(b"\xff\xff")
+            idx = self._skip_to_header()
             if idx == -1:
-                # preserve last byte if FF
-                if self.buffer and self.buffer[-1] == 0xFF:
-                    self.buffer = self.buffer[-1:]
-                else:
-                    self.buffer.clear()
                 return None
 
-            self.buffer = self.buffer[idx:]
-            if len(self.buffer) < 4:
+            if len(buffer) - idx < 4:
                 return None
 
-            length = self.buffer[3]
+            length = buffer[idx + 3]
             total_len = 4 + length
+            end = idx + total_len
 
-            if len(self.buffer) < total_len:
+            if len(buffer) < end:
                 return None
 
-            try:
-                pkt, _ = Packet.parse(self.buffer[:total_len])
-                self.buffer = self.buffer[total_len:]
-                return pkt
-            except ValueError:
+            # Verify the packet in place, the checksum being summed over the raw bytes in a single call
+            if total_len < 6 or (~sum(buffer[idx + 2 : end - 1])) & 0xFF != buffer[end - 1]:
                 # Invalid packet found at header, skip first byte and search again
-                self.buffer = self.buffer[1:]
+                self._head = idx + 1
                 continue
+
+            _, _, id, _, instruction = _header.unpack_from(buffer, idx)
+            pkt = Packet(id, instruction, bytes(buffer[idx + 5 : end - 1]))
+            self._head = end
+            return pkt
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import struct
+from collections.abc import Awaitable, Callable
 
 from .constants import Instruction, Memory, TorqueEnable
 from .driver import SCServoDriver
@@ -7,6 +9,9 @@ from .protocol import Packet
 
 logger = logging.getLogger(__name__)
 
+# Number of registers from PRESENT_POSITION_L to PRESENT_CURRENT_H
+_status_span = Memory.PRESENT_CURRENT_H - Memory.PRESENT_POSITION_L + 1
+
 
 def from_sign_magnitude(val: int, sign_bit: int = 15) -> int:
     if val & (1 << sign_bit):
@@ -32,6 +37,15 @@ class SCServo:
         self.driver = driver
         self.id = id
         self.endian = endian
+        # Byte order is resolved once, status registers are decoded in a single call
+        byte_order = ">" if endian == "big" else "<"
+        # Position, speed, load, voltage and temperature (56-63)
+        self._status_main_struct = struct.Struct(f"{byte_order}3HBB")
+        # Same plus moving (66) and current (69-70), skipping the undefined registers
+        self._status_span_struct = struct.Struct(f"{byte_order}3HBB2xB2xH")
+        self._word_struct = struct.Struct(f"{byte_order}H")
+        # Read the whole status span at once until the servo rejects it
+        self._burst_status_read = True
 
     async def _read(self, address: int, length: int) -> tuple[bytes | None, int]:
         pkt = Packet(self.id, Instruction.READ, [address, length])
@@ -40,22 +54,22 @@ class SCServo:
             # We return data if length matches, even if error is set
             # because some errors (like overload) might not prevent reading data
             if len(resp.params) == length:
-                return bytes(resp.params), resp.instruction
-            elif resp.instruction != 0:
-                # If error set and no data (or mismatch), return None data but error code
-                return None, resp.instruction
+                return resp.params, resp.instruction
+            # The servo answered without the expected data (error set or short payload),
+            # return None data but its status, -1 is kept for no response
+            return None, resp.instruction
         return None, -1
 
-    async def _write(self, address: int, data: list[int]) -> int:
-        params = [address] + data
+    async def _write(self, address: int, data: bytes | list[int]) -> int:
+        params = [address, *data]
         pkt = Packet(self.id, Instruction.WRITE, params)
         resp = await self.driver.send_packet(pkt)
         if resp:
             return resp.instruction
         return -1
 
-    async def _reg_write(self, address: int, data: list[int]) -> int:
-        params = [address] + data
+    async def _reg_write(self, address: int, data: bytes | list[int]) -> int:
+        params = [address, *data]
         pkt = Packet(self.id, Instruction.REG_WRITE, params)
         resp = await self.driver.send_packet(pkt)
         if resp:
@@ -81,11 +95,8 @@ class SCServo:
         val = TorqueEnable.ON if enable else TorqueEnable.OFF
         return await self._write(Memory.TORQUE_ENABLE, [val])
 
-    def _split_word(self, val: int) -> list[int]:
-        val = val & 0xFFFF
-        if self.endian == "big":
-            return [(val >> 8) & 0xFF, val & 0xFF]
-        return [val & 0xFF, (val >> 8) & 0xFF]
+    def _split_word(self, val: int) -> bytes:
+        return (val & 0xFFFF).to_bytes(2, self.endian)
 
     async def set_position(self, position: int, time: int = 0, speed: int = 0) -> int:
         # For SC Series (Big Endian):
@@ -93,18 +104,12 @@ class SCServo:
         # Order: PosH, PosL, TimeH, TimeL, SpeedH, SpeedL
 
         # Position is simply raw value (no sign conversion needed usually for write in SC protocol)
-        data = []
-        data.extend(self._split_word(position))
-        data.extend(self._split_word(time))
-        data.extend(self._split_word(speed))
+        data = self._split_word(position) + self._split_word(time) + self._split_word(speed)
 
         return await self._write(Memory.GOAL_POSITION_L, data)
 
     async def reg_write_position(self, position: int, time: int = 0, speed: int = 0) -> int:
-        data = []
-        data.extend(self._split_word(position))
-        data.extend(self._split_word(time))
-        data.extend(self._split_word(speed))
+        data = self._split_word(position) + self._split_word(time) + self._split_word(speed)
 
         return await self._reg_write(Memory.GOAL_POSITION_L, data)
 
@@ -144,6 +149,60 @@ class SCServo:
         return None
 
     async def read_status(self) -> dict:
+        if self._burst_status_read:
+            # Single read of the whole status span (56-70), the undefined registers in the gaps are ignored
+            data, error = await self._read(Memory.PRESENT_POSITION_L, _status_span)
+            if data and len(data) == _status_span:
+                return self._parse_status_span(data, error)
+            if error == -1:
+                # No response (timeout or corrupted reply), fall back this time only
+                return await self._read_status_split()
+            # The servo answered the burst read with an error or a short payload, stop trying it
+            logger.info(f"Servo {self.id}: burst status read rejected (error={error}), using split reads")
+            self._burst_status_read = False
+
+        return await self._read_status_split()
+
+    @staticmethod
+    async def sync_read_status(driver: SCServoDriver, servos: list["SCServo"]) -> dict[int, dict]:
+        """
+        Read the status of several servos sharing the same driver in one bus transaction.
+        Servos that do not support burst status reads are read individually.
+        A servo that does not answer gets an empty status, as with read_status.
+        Returns the status of each servo by ID.
+        """
+        burst_servos = [servo for servo in servos if servo._burst_status_read]
+        responses = await driver.sync_read(
+            [servo.id for servo in burst_servos], Memory.PRESENT_POSITION_L, _status_span
+        )
+
+        result = {}
+        for servo in servos:
+            if not servo._burst_status_read:
+                result[servo.id] = await servo.read_status()
+                continue
+            if (resp := responses.get(servo.id)) is None:
+                # No response, it will be polled again next time
+                result[servo.id] = {}
+                continue
+            if len(resp.params) == _status_span:
+                result[servo.id] = servo._parse_status_span(resp.params, resp.instruction)
+                continue
+            # The servo answered with an error or a short payload, read it individually from now on
+            logger.info(f"Servo {servo.id}: burst status read rejected (error={resp.instruction}), using split reads")
+            servo._burst_status_read = False
+            result[servo.id] = await servo.read_status()
+        return result
+
+    def _parse_status_span(self, data: bytes, error: int) -> dict:
+        *main, moving, raw_current = self._status_span_struct.unpack(data)
+        result = {} if error == -1 else {"error": error}
+        self._set_status_main(result, *main)
+        result["moving"] = moving
+        result["current"] = from_sign_magnitude(raw_current, 15)
+        return result
+
+    async def _read_status_split(self) -> dict:
         # Split reads to avoid reading gaps (undefined registers) which might return garbage or cause offsets
 
         # Block 1: 56-63 (Pos, Speed, Load, Volt, Temp)
@@ -165,32 +224,32 @@ class SCServo:
             result["error"] = error_current
 
         if data_main and len(data_main) == 8:
-            raw_pos = make_word(data_main[0], data_main[1], self.endian)
-            raw_speed = make_word(data_main[2], data_main[3], self.endian)
-            raw_load = make_word(data_main[4], data_main[5], self.endian)
-            volt = data_main[6]
-            temp = data_main[7]
-
-            result.update(
-                {
-                    "position": raw_pos,
-                    "speed": from_sign_magnitude(raw_speed, 15),
-                    "speed_raw": raw_speed,
-                    "load": from_sign_magnitude(raw_load, 10),
-                    "voltage": volt,
-                    "temperature": temp,
-                }
-            )
+            self._set_status_main(result, *self._status_main_struct.unpack(data_main))
 
         if data_moving:
             result["moving"] = data_moving[0]
 
         if data_current and len(data_current) == 2:
-            raw_current = make_word(data_current[0], data_current[1], self.endian)
+            (raw_current,) = self._word_struct.unpack(data_current)
             result["current"] = from_sign_magnitude(raw_current, 15)
 
         return result
 
+    @staticmethod
+    def _set_status_main(
+        result: dict, raw_pos: int, raw_speed: int, raw_load: int, voltage: int, temperature: int
+    ) -> None:
+        result.update(
+            {
+                "position": raw_pos,
+                "speed": from_sign_magnitude(raw_speed, 15),
+                "speed_raw": raw_speed,
+                "load": from_sign_magnitude(raw_load, 10),
+                "voltage": voltage,
+                "temperature": temperature,
+            }
+        )
+
     async def set_id(self, new_id: int) -> bool:
         """
         Change the ID of the servo.
@@ -201,6 +260,9 @@ class SCServo:
 
         # Write new ID
         res = await self._write(Memory.ID, [new_id])
+        if res == 0:
+            # The servo now answers on its new ID
+            self.id = new_id
 
         # Lock EPROM
         await self._write(Memory.LOCK, [1])
@@ -223,50 +285,121 @@ class SCServo:
                            HOWEVER, simple approach: check if position changes.
         load_threshold: If load is above this value when stopping, consider it blocked.
         """
-        import time
 
-        # Give a small delay for the servo to update its Moving bit after a write command
-        await asyncio.sleep(0.1)
+        async def read_statuses(_: list["SCServo"]) -> dict[int, dict]:
+            return {self.id: await self.read_status()}
 
-        start_time = time.time()
+        results = await _wait_until_stopped([self], read_statuses, interval, timeout, blocked_threshold, load_threshold)
+        return results[self.id]
 
-        last_pos = -1
-        blocked_counter = 0
+    @staticmethod
+    async def wait_for_stop_all(
+        driver: SCServoDriver,
+        servos: list["SCServo"],
+        interval: float = 0.05,
+        timeout: float = 5.0,
+        blocked_threshold: int = 5,
+        load_threshold: int = 100,
+    ) -> dict[int, str]:
+        """
+        Wait until several servos sharing the same driver stop moving.
+        All servos still moving are polled together with a single sync read per interval.
+        Returns the reason of each servo by ID: "reached", "blocked", "timeout"
 
-        while (time.time() - start_time) < timeout:
-            status = await self.read_status()
-            if not status:
-                await asyncio.sleep(interval)
-                continue
+        See wait_for_stop for the thresholds.
+        """
+
+        async def read_statuses(pending: list["SCServo"]) -> dict[int, dict]:
+            return await SCServo.sync_read_status(driver, pending)
+
+        return await _wait_until_stopped(servos, read_statuses, interval, timeout, blocked_threshold, load_threshold)
 
-            moving = status.get("moving", 1)  # Default to 1 (moving) if key missing
-            current_pos = status.get("position", 0)
-            current_load = status.get("load", 0)
-
-            # If moving flag goes to 0, we stopped.
-            # But did we reach target or hit an obstacle?
-            if moving == 0:
-                # If load is significant (e.g. > 50 or < -50), it means we are forcing against something
-                # Or if error bit is set (like overload, though that's in error byte)
-                if abs(current_load) > load_threshold:
-                    logger.warning(f"Blocked: Stopped but high load ({current_load} > {load_threshold})")
-                    return "blocked"
-                return "reached"
-
-            # Check for blocking while moving=1 (stalled but trying)
-            # If position hasn't changed significantly for X steps while Moving is 1
-            if abs(current_pos - last_pos) < blocked_threshold:
-                blocked_counter += 1
-            else:
-                blocked_counter = 0
-                last_pos = current_pos
-
-            # If we haven't moved enough for N cycles (defines blocking sensitivity)
-            # interval 0.05 * 10 = 0.5 sec
-            if blocked_counter > 10:
-                logger.warning(f"Blocked: Stalled at {current_pos} (stuck for 0.5s)")
+
+class _StopDetector:
+    """
+    Decide from successive status reads whether a servo has stopped, and why.
+    """
+
+    def __init__(self, servo_id: int, blocked_threshold: int, load_threshold: int):
+        self.servo_id = servo_id
+        self.blocked_threshold = blocked_threshold
+        self.load_threshold = load_threshold
+        self.last_pos = -1
+        self.blocked_counter = 0
+
+    def update(self, status: dict) -> str | None:
+        """
+        Returns "reached" or "blocked" once the servo has stopped, None while it is moving.
+        """
+        moving = status.get("moving", 1)  # Default to 1 (moving) if key missing
+        current_pos = status.get("position", 0)
+        current_load = status.get("load", 0)
+
+        # If moving flag goes to 0, we stopped.
+        # But did we reach target or hit an obstacle?
+        if moving == 0:
+            # If load is significant (e.g. > 50 or < -50), it means we are forcing against something
+            # Or if error bit is set (like overload, though that's in error byte)
+            if abs(current_load) > self.load_threshold:
+                logger.warning(
+                    f"Servo {self.servo_id}: Blocked: Stopped but high load ({current_load} > {self.load_threshold})"
+                )
                 return "blocked"
+            return "reached"
+
+        # Check for blocking while moving=1 (stalled but trying)
+        # If position hasn't changed significantly for X steps while Moving is 1
+        if abs(current_pos - self.last_pos) < self.blocked_threshold:
+            self.blocked_counter += 1
+        else:
+            self.blocked_counter = 0
+            self.last_pos = current_pos
+
+        # If we haven't moved enough for N cycles (defines blocking sensitivity)
+        # interval 0.05 * 10 = 0.5 sec
+        if self.blocked_counter > 10:
+            logger.warning(f"Servo {self.servo_id}: Blocked: Stalled at {current_pos} (stuck for 0.5s)")
+            return "blocked"
+
+        return None
 
-            await asyncio.sleep(interval)
 
-        return "timeout"
+async def _wait_until_stopped(
+    servos: list[SCServo],
+    read_statuses: Callable[[list[SCServo]], Awaitable[dict[int, dict]]],
+    interval: float,
+    timeout: float,
+    blocked_threshold: int,
+    load_threshold: int,
+) -> dict[int, str]:
+    """
+    Poll the status of the servos still moving until all of them have stopped or the timeout expires.
+    Returns the reason of each servo by ID: "reached", "blocked", "timeout"
+    """
+    loop = asyncio.get_running_loop()
+
+    # Give a small delay for the servos to update their Moving bit after a write command
+    await asyncio.sleep(0.1)
+
+    # Poll on a fixed cadence: the status read time is taken out of the sleep
+    # instead of being added to each interval.
+    deadline = loop.time() + timeout
+    next_poll = loop.time()
+
+    pending = {servo.id: (servo, _StopDetector(servo.id, blocked_threshold, load_threshold)) for servo in servos}
+    results: dict[int, str] = {}
+
+    while pending and (now := loop.time()) < deadline:
+        next_poll = max(next_poll + interval, now)
+        statuses = await read_statuses([servo for servo, _ in pending.values()])
+        for servo_id, status in statuses.items():
+            if status and (reason := pending[servo_id][1].update(status)):
+                results[servo_id] = reason
+                del pending[servo_id]
+
+        if pending:
+            await asyncio.sleep(next_poll - loop.time())
+
+    for servo_id in pending:
+        results[servo_id] = "timeout"
+    return results
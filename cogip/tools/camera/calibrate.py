@@ -1,3 +1,7 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Annotated
 
 import cv2
@@ -118,31 +122,46 @@ def cmd_calibrate(
     object_points = []
     image_points: list[cv2.typing.MatLike] = []
 
-    board_detector = cv2.aruco.CharucoDetector(board)
-
-    for im in sorted(captured_images)[0:]:
-        frame = cv2.imread(str(im))
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-        char_corners, char_ids, _, _ = board_detector.detectBoard(gray)
-        if char_corners is None or len(char_corners) == 0:
-            logger.info(f"{im}: KO")
-            continue
-
-        frame_obj_points, frame_img_points = board.matchImagePoints(char_corners, char_ids)
-
-        if len(frame_obj_points) < 4:
-            logger.info(f"{im}: KO (not enough points: {len(frame_obj_points)})")
-            continue
-
-        logger.info(f"{im}: OK ({len(frame_obj_points)} points)")
-        object_points.append(frame_obj_points)
-        image_points.append(frame_img_points)
+    # Images are independent and OpenCV releases the GIL while decoding and detecting,
+    # so process them in a thread pool, with one detector per thread.
+    local = threading.local()
 
+    def detect(im: Path) -> tuple[cv2.typing.MatLike | None, cv2.typing.MatLike | None, cv2.typing.MatLike | None]:
+        if (board_detector := getattr(local, "board_detector", None)) is None:
+            board_detector = local.board_detector = cv2.aruco.CharucoDetector(board)
         if debug:
-            cv2.aruco.drawDetectedCornersCharuco(frame, char_corners, char_ids)
-            cv2.imshow("img", frame)
-            cv2.waitKey(1000)
+            # The color frame is displayed with the detected corners
+            frame = cv2.imread(str(im))
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        else:
+            # Decode directly to a single channel
+            frame = None
+            gray = cv2.imread(str(im), cv2.IMREAD_GRAYSCALE)
+        char_corners, char_ids, _, _ = board_detector.detectBoard(gray)
+        return frame, char_corners, char_ids
+
+    images = sorted(captured_images)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # Results are yielded in image order
+        for im, (frame, char_corners, char_ids) in zip(images, executor.map(detect, images)):
+            if char_corners is None or len(char_corners) == 0:
+                logger.info(f"{im}: KO")
+                continue
+
+            frame_obj_points, frame_img_points = board.matchImagePoints(char_corners, char_ids)
+
+            if len(frame_obj_points) < 4:
+                logger.info(f"{im}: KO (not enough points: {len(frame_obj_points)})")
+                continue
+
+            logger.info(f"{im}: OK ({len(frame_obj_points)} points)")
+            object_points.append(frame_obj_points)
+            image_points.append(frame_img_points)
+
+            if debug:
+                cv2.aruco.drawDetectedCornersCharuco(frame, char_corners, char_ids)
+                cv2.imshow("img", frame)
+                cv2.waitKey(1000)
 
     ret, camera_matrix, dist_coefs, _, _ = cv2.calibrateCamera(
         object_points,
@@ -21,6 +21,7 @@ class Camera:
         height: int,
         stream_width: int | None = None,
         stream_height: int | None = None,
+        need_stream: bool = True,
     ):
         self.robot_id = robot_id
         self.name = name
@@ -29,6 +30,8 @@ class Camera:
         self.height = height
         self.stream_width = stream_width if stream_width else width
         self.stream_height = stream_height if stream_height else height
+        # If False, read() does not produce the stream frame
+        self.need_stream = need_stream
 
     def open(self):
         raise NotImplementedError()
@@ -50,8 +53,9 @@ class USBCamera(Camera):
         height: int,
         stream_width: int | None = None,
         stream_height: int | None = None,
+        need_stream: bool = True,
     ):
-        super().__init__(robot_id, name, codec, width, height, stream_width, stream_height)
+        super().__init__(robot_id, name, codec, width, height, stream_width, stream_height, need_stream)
         self.camera: cv2.VideoCapture | None = None
         params_path = Path(__file__).parent / "cameras" / str(robot_id)
         params_path /= f"{name.name}_{codec.name}_{width}x{height}"
@@ -83,7 +87,9 @@ class USBCamera(Camera):
         if not ret:
             return None, None
 
-        if self.width != self.stream_width or self.height != self.stream_height:
+        if not self.need_stream:
+            stream_frame = None
+        elif self.width != self.stream_width or self.height != self.stream_height:
             stream_frame = cv2.resize(frame, (self.stream_width, self.stream_height))
         else:
             stream_frame = frame
@@ -140,8 +146,9 @@ class RPiCamera(Camera):
         height: int,
         stream_width: int | None = None,
         stream_height: int | None = None,
+        need_stream: bool = True,
     ):
-        super().__init__(robot_id, name, codec, width, height, stream_width, stream_height)
+        super().__init__(robot_id, name, codec, width, height, stream_width, stream_height, need_stream)
         # Detect camera type (imx219, imx296, etc.)
         self.camera_type = Path(name.val).read_text().partition(" ")[0]
         params_path = Path(__file__).parent / "cameras" / str(robot_id)
@@ -174,13 +181,11 @@ class RPiCamera(Camera):
     @final
     def read(self) -> tuple[cv2.typing.MatLike | None, cv2.typing.MatLike | None]:
         request = self.camera.capture_request()
-        main = request.make_array("main")
+        # main is RGB888 (for display), skip its full size copy if it is not used
+        stream_frame = request.make_array("main") if self.need_stream else None
         lores = request.make_array("lores")
         request.release()
 
-        # main is RGB888 (for display)
-        stream_frame = main
-
         # lores is YUV420 (for detection). Extract Y plane.
         frame = None
         if lores is not None and lores.shape[0] == self.stream_height * 3 // 2:
@@ -239,8 +244,9 @@ class SimCamera(Camera):
         height: int,
         stream_width: int | None = None,
         stream_height: int | None = None,
+        need_stream: bool = True,
     ):
-        super().__init__(robot_id, name, codec, width, height, stream_width, stream_height)
+        super().__init__(robot_id, name, codec, width, height, stream_width, stream_height, need_stream)
         self.shared_memory: SharedMemory | None = None
         self.shared_sim_camera_data_lock: WritePriorityLock | None = None
         params_path = Path(__file__).parent / "cameras" / str(robot_id)
@@ -262,7 +268,9 @@ class SimCamera(Camera):
         frame = cv2.cvtColor(self.shared_sim_camera_data, cv2.COLOR_RGBA2BGR)
         self.shared_sim_camera_data_lock.finish_reading()
 
-        if self.width != self.stream_width or self.height != self.stream_height:
+        if not self.need_stream:
+            stream_frame = None
+        elif self.width != self.stream_width or self.height != self.stream_height:
             stream_frame = cv2.resize(frame, (self.stream_width, self.stream_height))
         else:
             stream_frame = frame
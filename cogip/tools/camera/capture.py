@@ -1,9 +1,9 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
 import cv2
-import cv2.typing
 import typer
 
 from . import logger
@@ -102,7 +102,7 @@ def cmd_capture(
 ):
     """Capture images to be used by the 'calibrate' command"""
     exit_key = 27  # use this key (Esc) to exit before max_frames
-    captures_frames: list[cv2.typing.MatLike] = []  # Captured frames
+    nb_captured_frames = 0
     preview_window_name = "Detection Preview - Press Esc to exit"
 
     cv2.namedWindow(preview_window_name, cv2.WINDOW_NORMAL)
@@ -120,6 +120,7 @@ def cmd_capture(
         aruco_dict,
     )
     board.setLegacyPattern(charuco_legacy)
+    board_detector = cv2.aruco.CharucoDetector(board)
 
     if camera_name == CameraName.rpicam:
         CameraClass = RPiCamera
@@ -128,22 +129,31 @@ def cmd_capture(
     camera = CameraClass(id, camera_name, camera_codec, camera_width, camera_height)
     camera.open()
 
+    logger.info(f"Writing captured frames in: {camera.capture_path}")
+    shutil.rmtree(camera.capture_path, ignore_errors=True)
+    camera.capture_path.mkdir(parents=True, exist_ok=True)
+
+    # Frames are encoded and written in the background while capture goes on,
+    # cv2.imwrite releases the GIL during encoding.
+    writer = ThreadPoolExecutor(max_workers=2)
+
     i = capture_interval
     while True:
         frame, stream_frame = camera.read()
         if frame is None:
             continue
 
-        board_detector = cv2.aruco.CharucoDetector(board)
-
         k = cv2.waitKey(1)
         if k == exit_key:
             break
         elif i == 0:
             i = capture_interval
-            captures_frames.append(frame)
-            logger.info(f"Frame captured: {len(captures_frames)}")
-            if len(captures_frames) == max_frames:
+            filename = camera.capture_path / f"image_{nb_captured_frames:03}.jpg"
+            # The preview is drawn on stream_frame, do not share it with the writer
+            writer.submit(cv2.imwrite, str(filename), frame.copy() if stream_frame is frame else frame)
+            nb_captured_frames += 1
+            logger.info(f"Frame captured: {nb_captured_frames}")
+            if nb_captured_frames == max_frames:
                 break
         i -= 1
 
@@ -153,9 +163,4 @@ def cmd_capture(
         cv2.imshow(preview_window_name, stream_frame)
 
     camera.close()
-    logger.info(f"Writing captured frames in: {camera.capture_path}")
-    shutil.rmtree(camera.capture_path, ignore_errors=True)
-    camera.capture_path.mkdir(parents=True, exist_ok=True)
-    for n, frame in enumerate(captures_frames):
-        filename = camera.capture_path / f"image_{n:03}.jpg"
-        cv2.imwrite(str(filename), frame)
+    writer.shutdown(wait=True)
@@ -104,7 +104,7 @@ def show_stream(id: int, name: CameraName, codec: VideoCodec, width: int, height
         CameraClass = RPiCamera
     else:
         CameraClass = USBCamera
-    camera = CameraClass(id, name, codec, width, height)
+    camera = CameraClass(id, name, codec, width, height, need_stream=False)
 
     camera.open()
 
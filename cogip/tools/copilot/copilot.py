@@ -4,14 +4,13 @@ import traceback
 
 import socketio
 from google.protobuf.json_format import MessageToDict
-from pydantic import TypeAdapter
 
 from cogip import models
 from cogip.cpp.libraries.models import MotionDirection
 from cogip.cpp.libraries.models import PoseBuffer as SharedPoseBuffer
 from cogip.cpp.libraries.models import PoseOrderList as SharedPoseOrderList
 from cogip.cpp.libraries.shared_memory import LockName, SharedMemory, WritePriorityLock
-from cogip.models.actuators import ActuatorsKindEnum, ActuatorState
+from cogip.models.actuators import ActuatorState, BoolSensorState, PositionalActuatorState
 from cogip.protobuf import (
     PB_ActuatorState,
     PB_EmergencyStopStatus,
@@ -233,19 +232,19 @@ class Copilot:
         if message:
             await self.loop.run_in_executor(None, pb_actuator_state.ParseFromString, message)
 
-        kind = pb_actuator_state.WhichOneof("type")
-        actuator_state = MessageToDict(
-            getattr(pb_actuator_state, kind),
-            always_print_fields_with_no_presence=True,
-            preserving_proto_field_name=True,
-            use_integers_for_enums=True,
-        )
-        actuator_state["kind"] = ActuatorsKindEnum[kind]
-        state_schema = TypeAdapter(ActuatorState).validate_python(actuator_state)
-        logger.info(f"[CAN] Received actuator state: {state_schema}")
+        state: ActuatorState
+        match kind := pb_actuator_state.WhichOneof("type"):
+            case "positional_actuator":
+                state = PositionalActuatorState.from_pb(pb_actuator_state.positional_actuator)
+            case "bool_sensor":
+                state = BoolSensorState.from_pb(pb_actuator_state.bool_sensor)
+            case _:
+                logger.warning(f"[CAN] Unknown actuator state kind: {kind}")
+                return
+        logger.info(f"[CAN] Received actuator state: {state}")
 
         if self.sio_events.connected:
-            await self.sio_events.emit("actuator_state", actuator_state)
+            await self.sio_events.emit("actuator_state", state.model_dump())
 
     async def handle_pose_reached(self) -> None:
         """
@@ -3,7 +3,7 @@ from typing import Any
 
 import polling2
 import socketio
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 
 from cogip import models
 from cogip.cpp.libraries.models import MotionDirection
@@ -121,7 +121,11 @@ class SioEvents(socketio.AsyncClientNamespace):
         Forward to mcu-firmware.
         """
         logger.info(f"[SIO] Actuator command: {data}")
-        command = TypeAdapter(ActuatorCommand).validate_python(data)
+        try:
+            command = TypeAdapter(ActuatorCommand).validate_python(data)
+        except ValidationError as exc:
+            logger.error(f"[SIO] Actuator command rejected: {exc}")
+            return
 
         pb_command = PB_ActuatorCommand()
         if isinstance(command, PositionalActuatorCommand):
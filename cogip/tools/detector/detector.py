@@ -160,11 +160,8 @@ class Detector:
         # self.shared_lidar_coords_lock.register_consumer()
 
         # Lidar data is initialized to -1 to indicate that no data is available
-        self.shared_lidar_data[0][0] = -1
-        self.shared_lidar_data[0][1] = -1
-        self.shared_lidar_data[0][2] = -1
-        self.shared_lidar_coords[0][0] = -1
-        self.shared_lidar_coords[0][1] = -1
+        self.shared_lidar_data[0] = -1
+        self.shared_lidar_coords[0] = -1
 
         self.lidar_data_converter = LidarDataConverter(f"cogip_{self.robot_id}")
         self.lidar_data_converter.set_pose_current_index(self.properties.sensor_delay)
@@ -105,10 +105,7 @@ class DetectorGUI:
         if not self.detector.shared_pose_current_buffer:
             return
 
-        pose_current = self.detector.shared_pose_current_buffer.last
-        x = pose_current.x
-        y = pose_current.y
-        angle = pose_current.angle
+        x, y, angle = self.detector.shared_pose_current_buffer.last_xyo()
 
         self.robot_marker.set_offsets([y, x])
 
@@ -72,9 +72,7 @@ class FirmwareTelemetryManager:
         Returns:
             The telemetry value, or default if not found.
         """
-        if key in self.data:
-            return self.data[key]
-        return default
+        return self.data.get(key, default)
 
     def get_model(self, key: str) -> TelemetryData:
         """
@@ -7,39 +7,38 @@ Node {
     property real angleDeg: 0
     property vector3d directionVector: Qt.vector3d(1, 0, 0)
     property real distance: 0
+    property Material hitMaterial: null
+    property Node hitParent: null
     property real ninjaHeight: 62.8
     property real ninjaShiftX: 50.0
     property real pamiHeight: 60.8
     property real pamiShiftX: 75.5
-    property real rayLength: 4000
     property Node relativeParent: null
     property real robotHeight: 380
     property int robotId: 1
     property real robotShiftX: 0
-    property Node sceneRoot: null
+    // Sensor position in the robot frame, shared by all rays of the same robot
+    readonly property vector3d sensorOrigin: Qt.vector3d(sensorShiftX, 0, sensorHeight)
     readonly property real sensorHeight: robotId === 1 ? robotHeight : robotId === 2 ? ninjaHeight : pamiHeight
     readonly property real sensorShiftX: robotId === 1 ? robotShiftX : robotId === 2 ? ninjaShiftX : pamiShiftX
     property View3D view3d: null
 
     function hasValidScene() {
-        return !!(view3d && view3d.scene);
+        return !!(view3d && view3d.scene && relativeParent);
     }
 
-    function pick() {
+    // Cast the ray from the sensor origin, already mapped to the scene by the caller
+    // since it is the same for all rays of a robot.
+    function pick(origin) {
         if (!hasValidScene()) {
             return;
         }
-        if (robotId > 1 && 90 < angleDeg && angleDeg < 270) {
-            return;
-        }
-        const origin = originRayNode.position;
-        const dirVector = Qt.vector3d(directionRayNode.position.x - origin.x, directionRayNode.position.y - origin.y, directionRayNode.position.z - origin.z);
-        const dirLength = Math.sqrt(dirVector.x * dirVector.x + dirVector.y * dirVector.y + dirVector.z * dirVector.z);
+        const dirVector = relativeParent.mapDirectionToScene(directionVector);
+        const dirLength = dirVector.length();
         if (dirLength < 0.0001) {
             return;
         }
-        const dirNorm = Qt.vector3d(dirVector.x / dirLength, dirVector.y / dirLength, dirVector.z / dirLength);
-        const result = view3d.rayPickAll(origin, dirNorm);
+        const result = view3d.rayPickAll(origin, dirVector.times(1 / dirLength));
         let hit = null;
         for (let i = 0; i < result.length; ++i) {
             const candidate = result[i];
@@ -66,91 +65,24 @@ Node {
         }
     }
 
-    function updatePositions() {
+    function updateDirection() {
         const angleRad = angleDeg * Math.PI / 180;
         directionVector = Qt.vector3d(Math.cos(angleRad), Math.sin(angleRad), 0);
-
-        if (!hasValidScene()) {
-            return;
-        }
-
-        originRayNode.updatePosition();
-        directionRayNode.updatePosition();
-    }
-
-    Component.onCompleted: updatePositions()
-    onAngleDegChanged: updatePositions()
-    onRelativeParentChanged: updatePositions()
-    onSceneRootChanged: updatePositions()
-    onView3dChanged: updatePositions()
-
-    Connections {
-        function onEulerRotationChanged() {
-            root.updatePositions();
-        }
-
-        function onPositionChanged() {
-            root.updatePositions();
-        }
-
-        function onScaleChanged() {
-            root.updatePositions();
-        }
-
-        target: root.relativeParent
-    }
-
-    Connections {
-        function onEulerRotationChanged() {
-            root.updatePositions();
-        }
-
-        function onPositionChanged() {
-            root.updatePositions();
-        }
-
-        function onScaleChanged() {
-            root.updatePositions();
-        }
-
-        target: root.sceneRoot
     }
 
-    Node {
-        id: originRayNode
-
-        function updatePosition() {
-            position = root.relativeParent.mapPositionToScene(Qt.vector3d(root.sensorShiftX, root.directionVector.y, root.sensorHeight));
-        }
-
-        parent: root.view3d.scene
-    }
-
-    Node {
-        id: directionRayNode
-
-        function updatePosition() {
-            position = root.relativeParent.mapPositionToScene(Qt.vector3d(root.sensorShiftX + root.directionVector.x * root.rayLength, root.directionVector.y * root.rayLength, root.sensorHeight));
-        }
-
-        parent: root.view3d.scene
-    }
+    onAngleDegChanged: updateDirection()
 
     Model {
         id: hitGlobalModel
 
-        parent: root.view3d.scene
+        castsShadows: false
+        parent: root.hitParent ? root.hitParent : root.view3d.scene
         pickable: false
+        receivesShadows: false
         scale: Qt.vector3d(0.2, 0.2, 0.2)
         source: "#Sphere"
         visible: false
 
-        materials: [
-            PrincipledMaterial {
-                baseColor: Qt.rgba(1.0, 0, 0, 1.0)
-                metalness: 0.0
-                roughness: 0.4
-            }
-        ]
+        materials: root.hitMaterial ? [root.hitMaterial] : []
     }
 }
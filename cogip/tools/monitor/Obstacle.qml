@@ -6,8 +6,10 @@ Node {
 
     property real baseHeight: 350
     property real baseLength: 225
+    property Material baseMaterial: null
     property real baseWidth: 225
     property real beaconLength: 80
+    property Material beaconMaterial: null
     property real beaconRadius: 35
     property bool dragging: false
     property int obstacleId: -1
@@ -23,11 +25,7 @@ Node {
         scale: Qt.vector3d(obstacleRoot.baseWidth / 100, obstacleRoot.baseLength / 100, obstacleRoot.baseHeight / 100)
         source: "#Cube"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#ff8c42"
-            }
-        ]
+        materials: obstacleRoot.baseMaterial ? [obstacleRoot.baseMaterial] : []
     }
 
     Model {
@@ -40,10 +38,6 @@ Node {
         scale: Qt.vector3d(obstacleRoot.beaconRadius * 2 / 100, obstacleRoot.beaconLength / 100, obstacleRoot.beaconRadius * 2 / 100)
         source: "#Cylinder"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#ffcc33"
-            }
-        ]
+        materials: obstacleRoot.beaconMaterial ? [obstacleRoot.beaconMaterial] : []
     }
 }
@@ -71,8 +71,10 @@ Node {
             required property int index
             property var segment: polylineRoot.segments[index]
 
+            castsShadows: false
             eulerRotation: Qt.vector3d(0, 0, segment.yaw)
             position: segment.position
+            receivesShadows: false
             scale: Qt.vector3d(segment.length / 100, polylineRoot.thickness / 100, polylineRoot.thickness / 100)
             source: "#Cube"
 
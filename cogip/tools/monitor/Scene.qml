@@ -182,6 +182,8 @@ Item {
         property string groundTextureSource: sceneRoot.tableGroundTexture
         property int lidarRayBatch: 360
         property int lidarRayCount: 360
+        property list<real> lidarRayDistances: []
+        property var lidarRayDirections: []
         property int lidarRayIndex: 0
         property var lidarRayNodes: []
         property int lidarTimerInterval: 16
@@ -348,13 +350,29 @@ Item {
         function createLidarRayNodes(parentNode, robotId) {
             deleteLidarRayNodes();
 
+            if (lidarRayDirections.length !== lidarRayCount) {
+                // Ray directions only depend on the angle, compute them once for all robots
+                const directions = [];
+                for (let i = 0; i < lidarRayCount; ++i) {
+                    const angleRad = i * Math.PI / 180;
+                    directions.push(Qt.vector3d(Math.cos(angleRad), Math.sin(angleRad), 0));
+                }
+                lidarRayDirections = directions;
+            }
+
             for (let i = 0; i < lidarRayCount; ++i) {
+                if (robotId > 1 && 90 < i && i < 270) {
+                    // Angles blocked by the chassis, never hit anything
+                    continue;
+                }
                 const node = lidarRayComponent.createObject(view.scene, {
                     view3d: view,
+                    hitMaterial: lidarHitMaterial,
+                    hitParent: lidarHitGroup,
                     relativeParent: parentNode,
-                    sceneRoot: sceneGroup,
                     robotId: robotId,
-                    angleDeg: i
+                    angleDeg: i,
+                    directionVector: lidarRayDirections[i]
                 });
                 if (node) {
                     lidarRayNodes.push(node);
@@ -390,6 +408,7 @@ Item {
                 }
             }
             lidarRayNodes = [];
+            lidarRayDistances = [];
             lidarRayIndex = 0;
         }
 
@@ -522,9 +541,31 @@ Item {
             id: obstacleComponent
 
             Components.Obstacle {
+                baseMaterial: obstacleBaseMaterial
+                beaconMaterial: obstacleBeaconMaterial
             }
         }
 
+        // Shared by all manual obstacles
+        DefaultMaterial {
+            id: obstacleBaseMaterial
+
+            diffuseColor: "#ff8c42"
+        }
+
+        DefaultMaterial {
+            id: obstacleBeaconMaterial
+
+            diffuseColor: "#ffcc33"
+        }
+
+        // Shared by all dynamic obstacles
+        DefaultMaterial {
+            id: dynamicObstacleMaterial
+
+            diffuseColor: Qt.rgba(1, 0.3, 0.3, 0.65)
+        }
+
         Component {
             id: lidarRayComponent
 
@@ -532,6 +573,22 @@ Item {
             }
         }
 
+        // Shared by all lidar hit markers so they can be batched together
+        PrincipledMaterial {
+            id: lidarHitMaterial
+
+            baseColor: Qt.rgba(1.0, 0, 0, 1.0)
+            metalness: 0.0
+            roughness: 0.4
+        }
+
+        // Parent of all lidar hit markers, shows or hides them all at once
+        Node {
+            id: lidarHitGroup
+
+            visible: view.virtualDetector
+        }
+
         Component {
             id: liveRobotComponent
 
@@ -883,16 +940,16 @@ Item {
                 Repeater3D {
                     id: rectangleObstacleRepeater
 
-                    model: view.rectangleObstacles
+                    // Bind on the count so delegates are reused when only obstacle data changes
+                    model: view.rectangleObstacles.length
 
                     delegate: Node {
                         id: rectangleObstacleNode
 
                         property var boundingPoints: []
                         required property int index
-                        required property var modelData
                         readonly property real obstacleAngle: obstacleData && obstacleData.angle !== undefined ? obstacleData.angle : 0
-                        property var obstacleData: modelData
+                        property var obstacleData: view.rectangleObstacles[index]
                         readonly property real obstacleHeight: 4
                         readonly property real obstacleLengthX: obstacleData && obstacleData.length_x !== undefined ? obstacleData.length_x : 0
                         readonly property real obstacleLengthY: obstacleData && obstacleData.length_y !== undefined ? obstacleData.length_y : 0
@@ -907,10 +964,10 @@ Item {
                             }
                             const list = [];
                             for (let i = 0; i < source.length; ++i) {
-                                const point = source[i] || {};
+                                const point = source[i] || [0, 0];
                                 list.push({
-                                    x: point.x,
-                                    y: point.y,
+                                    x: point[0],
+                                    y: point[1],
                                     z: 2
                                 });
                             }
@@ -933,19 +990,17 @@ Item {
                         Model {
                             id: rectangleObstacleModel
 
+                            castsShadows: false
                             eulerRotation: Qt.vector3d(0, 0, rectangleObstacleNode.obstacleAngle)
                             objectName: rectangleObstacleNode.objectName
                             opacity: 0.65
                             pickable: false
                             position: Qt.vector3d(rectangleObstacleNode.obstacleX, rectangleObstacleNode.obstacleY, rectangleObstacleNode.obstacleHeight / 2)
+                            receivesShadows: false
                             scale: Qt.vector3d(Math.max(rectangleObstacleNode.obstacleLengthX, 1) / 100, Math.max(rectangleObstacleNode.obstacleLengthY, 1) / 100, rectangleObstacleNode.obstacleHeight / 100)
                             source: "#Cube"
 
-                            materials: [
-                                DefaultMaterial {
-                                    diffuseColor: Qt.rgba(1, 0.3, 0.3, 0.65)
-                                }
-                            ]
+                            materials: [dynamicObstacleMaterial]
                         }
 
                         Components.Polyline3D {
@@ -963,16 +1018,16 @@ Item {
                 Repeater3D {
                     id: circleObstacleRepeater
 
-                    model: view.circleObstacles
+                    // Bind on the count so delegates are reused when only obstacle data changes
+                    model: view.circleObstacles.length
 
                     delegate: Node {
                         id: circleObstacleNode
 
                         property var boundingPoints: []
                         required property int index
-                        required property var modelData
                         readonly property real obstacleAngle: obstacleData && obstacleData.angle !== undefined ? obstacleData.angle : 0
-                        property var obstacleData: modelData
+                        property var obstacleData: view.circleObstacles[index]
                         readonly property real obstacleHeight: 4
                         readonly property real obstacleRadius: obstacleData && obstacleData.radius !== undefined ? obstacleData.radius : 0
                         readonly property real obstacleX: obstacleData && obstacleData.x !== undefined ? obstacleData.x : 0
@@ -988,8 +1043,8 @@ Item {
                             for (let i = 0; i < source.length; ++i) {
                                 const point = source[i];
                                 list.push({
-                                    x: isNaN(point.x) ? 0 : point.x,
-                                    y: isNaN(point.y) ? 0 : point.y,
+                                    x: isNaN(point[0]) ? 0 : point[0],
+                                    y: isNaN(point[1]) ? 0 : point[1],
                                     z: 2
                                 });
                             }
@@ -1012,19 +1067,17 @@ Item {
                         Model {
                             id: circleObstacleModel
 
+                            castsShadows: false
                             eulerRotation: Qt.vector3d(90, 0, circleObstacleNode.obstacleAngle)
                             objectName: circleObstacleNode.objectName
                             opacity: 0.765
                             pickable: false
                             position: Qt.vector3d(circleObstacleNode.obstacleX, circleObstacleNode.obstacleY, circleObstacleNode.obstacleHeight / 2)
+                            receivesShadows: false
                             scale: Qt.vector3d(Math.max(circleObstacleNode.obstacleRadius * 2, 1) / 100, circleObstacleNode.obstacleHeight / 100, Math.max(circleObstacleNode.obstacleRadius * 2, 1) / 100)
                             source: "#Cylinder"
 
-                            materials: [
-                                DefaultMaterial {
-                                    diffuseColor: Qt.rgba(1, 0.3, 0.3, 0.65)
-                                }
-                            ]
+                            materials: [dynamicObstacleMaterial]
                         }
 
                         Components.Polyline3D {
@@ -1263,13 +1316,26 @@ Item {
                 if (!view.lidarRayNodes || view.lidarRayNodes.length === 0) {
                     return;
                 }
-                for (let i = 0; i < view.lidarRayBatch; ++i) {
+                const first = view.lidarRayNodes[0];
+                if (!first || !first.relativeParent) {
+                    return;
+                }
+                // All rays start from the same sensor origin, map it once per batch
+                const origin = first.relativeParent.mapPositionToScene(first.sensorOrigin);
+                const batch = Math.min(view.lidarRayBatch, view.lidarRayNodes.length);
+                for (let i = 0; i < batch; ++i) {
                     const node = view.lidarRayNodes[view.lidarRayIndex];
                     if (node) {
-                        node.pick();
+                        node.pick(origin);
                     }
                     view.lidarRayIndex = (view.lidarRayIndex + 1) % view.lidarRayNodes.length;
                 }
+                // Gather distances here so the backend reads them in a single property access
+                const distances = [];
+                for (const node of view.lidarRayNodes) {
+                    distances.push(node.distance);
+                }
+                view.lidarRayDistances = distances;
                 view.postLidarUpdate();
             }
         }
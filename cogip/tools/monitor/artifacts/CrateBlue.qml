@@ -14,11 +14,7 @@ Node {
         scale: Qt.vector3d(1.50, 0.5, 0.3)
         source: "#Cube"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#d9b484"
-            }
-        ]
+        materials: [CrateMaterials.body]
     }
 
     Model {
@@ -29,13 +25,7 @@ Node {
         scale: Qt.vector3d(0.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseMap: Texture {
-                    source: "../../../../assets/crate_blue_tag.webp"
-                }
-            }
-        ]
+        materials: [CrateMaterials.blueTag]
     }
 
     Model {
@@ -46,11 +36,7 @@ Node {
         scale: Qt.vector3d(1.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#005b8c"
-            }
-        ]
+        materials: [CrateMaterials.blueFace]
     }
 
     Model {
@@ -62,13 +48,7 @@ Node {
         scale: Qt.vector3d(0.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseMap: Texture {
-                    source: "../../../../assets/crate_yellow_tag.webp"
-                }
-            }
-        ]
+        materials: [CrateMaterials.yellowTag]
     }
 
     Model {
@@ -80,11 +60,7 @@ Node {
         scale: Qt.vector3d(1.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#f7b500"
-            }
-        ]
+        materials: [CrateMaterials.yellowFace]
     }
 
     Model {
@@ -96,11 +72,7 @@ Node {
         scale: Qt.vector3d(0.50, 0.30, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#ffffff"
-            }
-        ]
+        materials: [CrateMaterials.side]
     }
 
     Model {
@@ -112,10 +84,6 @@ Node {
         scale: Qt.vector3d(0.50, 0.30, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#ffffff"
-            }
-        ]
+        materials: [CrateMaterials.side]
     }
 }
@@ -14,11 +14,7 @@ Node {
         scale: Qt.vector3d(1.50, 0.5, 0.3)
         source: "#Cube"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#282828"
-            }
-        ]
+        materials: [CrateMaterials.emptyBody]
     }
 
     Model {
@@ -29,13 +25,7 @@ Node {
         scale: Qt.vector3d(0.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseMap: Texture {
-                    source: "../../../../assets/crate_empty_tag.webp"
-                }
-            }
-        ]
+        materials: [CrateMaterials.emptyTag]
     }
 
     Model {
@@ -46,11 +36,7 @@ Node {
         scale: Qt.vector3d(1.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#000000"
-            }
-        ]
+        materials: [CrateMaterials.emptyFace]
     }
 
     Model {
@@ -62,13 +48,7 @@ Node {
         scale: Qt.vector3d(0.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseMap: Texture {
-                    source: "../../../../assets/crate_empty_tag.webp"
-                }
-            }
-        ]
+        materials: [CrateMaterials.emptyTag]
     }
 
     Model {
@@ -80,11 +60,7 @@ Node {
         scale: Qt.vector3d(1.50, 0.50, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#000000"
-            }
-        ]
+        materials: [CrateMaterials.emptyFace]
     }
 
     Model {
@@ -96,11 +72,7 @@ Node {
         scale: Qt.vector3d(0.50, 0.30, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#ffffff"
-            }
-        ]
+        materials: [CrateMaterials.side]
     }
 
     Model {
@@ -112,10 +84,6 @@ Node {
         scale: Qt.vector3d(0.50, 0.30, 1)
         source: "#Rectangle"
 
-        materials: [
-            DefaultMaterial {
-                diffuseColor: "#ffffff"
-            }
-        ]
+        materials: [CrateMaterials.side]
     }
 }
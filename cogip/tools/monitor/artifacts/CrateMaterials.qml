@@ -0,0 +1,41 @@
+pragma Singleton
+
+import QtQuick
+import QtQuick3D
+
+// Materials shared by all crate instances, crates are static and only differ by their position
+QtObject {
+    readonly property DefaultMaterial blueFace: DefaultMaterial {
+        diffuseColor: "#005b8c"
+    }
+    readonly property DefaultMaterial blueTag: DefaultMaterial {
+        diffuseMap: Texture {
+            source: "../../../../assets/crate_blue_tag.webp"
+        }
+    }
+    readonly property DefaultMaterial body: DefaultMaterial {
+        diffuseColor: "#d9b484"
+    }
+    readonly property DefaultMaterial emptyBody: DefaultMaterial {
+        diffuseColor: "#282828"
+    }
+    readonly property DefaultMaterial emptyFace: DefaultMaterial {
+        diffuseColor: "#000000"
+    }
+    readonly property DefaultMaterial emptyTag: DefaultMaterial {
+        diffuseMap: Texture {
+            source: "../../../../assets/crate_empty_tag.webp"
+        }
+    }
+    readonly property DefaultMaterial side: DefaultMaterial {
+        diffuseColor: "#ffffff"
+    }
+    readonly property DefaultMaterial yellowFace: DefaultMaterial {
+        diffuseColor: "#f7b500"
+    }
+    readonly property DefaultMaterial yellowTag: DefaultMaterial {
+        diffuseMap: Texture {
+            source: "../../../../assets/crate_yellow_tag.webp"
+        }
+    }
+}
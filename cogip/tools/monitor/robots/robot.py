@@ -1,18 +1,15 @@
-from functools import partial
-
-from PySide6.QtCore import QObject, QTimer
+import numpy as np
+from numpy.typing import NDArray
+from PySide6.QtCore import QObject
 from PySide6.QtCore import SignalInstance as QtSignalInstance
 from PySide6.QtGui import QVector3D
 from PySide6.QtQml import QJSValue, QJSValueIterator
 
-from cogip.models import models
 from .. import logger
 from ..shared_memory import SharedMemoryManager
 
 
 class Robot:
-    update_pose_current_interval: int = 100
-
     def __init__(
         self,
         root: QObject,
@@ -28,53 +25,40 @@ class Robot:
         self.virtual_planner = virtual_planner
         self.virtual_detector = virtual_detector
         self.shm = SharedMemoryManager()
-        self.lidar_ray_nodes: dict[int, QObject] = {}
+        self.lidar_ray_angles: NDArray = np.empty(0, dtype=np.intp)
         self.lidar_distances_changed: bool = False
+        self.euler_rotation = QVector3D(0, 0, 0)
+        self.pose_current: tuple[float, float, float] | None = None
 
         self.node = self.root.findChild(QObject, "Robot")
         self.models = [m for m in self.node.children() if m.metaObject().className() == "QQuick3DModel"]
         for model in self.models:
             model.setObjectName(f"robot_{model.objectName()}")
 
-        self.update_pose_current_timer = QTimer(self.root)
-        self.update_pose_current_timer.setInterval(Robot.update_pose_current_interval)
-        self.update_pose_current_timer.timeout.connect(self.update_pose_current_from_shm)
-
-        if self.virtual_planner:
-            self.update_pose_current_timer.start()
-
         if self.virtual_detector:
-            for i in range(360):
-                self.shm.shared_lidar_data[i][0] = i
-                self.shm.shared_lidar_data[i][2] = 255
-            if self.robot_id > 1:
-                for i in range(90, 270):
-                    self.shm.shared_lidar_data[i][1] = 65535
-            self.shm.shared_lidar_data[360][0] = -1
-
-            # Find Lidar ray nodes
+            # All rays start without hit, including those blocked by the chassis that will never be updated
+            self.shm.shared_lidar_data_lock.start_writing()
+            self.shm.shared_lidar_data[:360, 0] = np.arange(360)
+            self.shm.shared_lidar_data[:360, 1] = 65535
+            self.shm.shared_lidar_data[:360, 2] = 255
+            self.shm.shared_lidar_data[360, 0] = -1
+            self.shm.shared_lidar_data_lock.finish_writing()
+
+            # Record the angles of Lidar ray nodes, node references are not kept
+            # since distances are gathered by the view
             if self.view is None:
                 logger.warning("Unable to locate View3D instance for lidar ray binding")
             else:
                 lidar_ray_nodes_prop: QJSValue = self.view.property("lidarRayNodes")
+                angles: list[int] = []
                 it = QJSValueIterator(lidar_ray_nodes_prop)
                 while it.hasNext():
                     it.next()
-                    try:
-                        index = int(it.name())
-                    except ValueError:
-                        continue
                     q_object = it.value().toQObject()
                     if not q_object:
                         continue
-                    self.lidar_ray_nodes[index] = q_object
-
-                    try:
-                        signal_distance_changed: QtSignalInstance = q_object.distanceChanged
-                        if isinstance(signal_distance_changed, QtSignalInstance):
-                            signal_distance_changed.connect(partial(self.handle_distance_changed, index))
-                    except AttributeError:
-                        continue
+                    angles.append(int(q_object.property("angleDeg")))
+                self.lidar_ray_angles = np.array(angles, dtype=np.intp)
 
                 try:
                     signal_post_lidar_update: QtSignalInstance = self.view.postLidarUpdate
@@ -90,36 +74,46 @@ class Robot:
         if self.shm.shared_pose_current_buffer is None:
             return
 
-        pose_current = self.shm.shared_pose_current_buffer.last
-        if pose_current is None or self.root is None:
+        if self.root is None:
             return
 
-        self.root.setProperty("x", pose_current.x)
-        self.root.setProperty("y", pose_current.y)
-        self.root.setProperty("eulerRotation", QVector3D(0, 0, pose_current.angle))
+        self.update_pose_current(*self.shm.shared_pose_current_buffer.last_xyo())
 
-    def update_pose_current_from_model(self, pose_current: models.Pose) -> None:
+    def update_pose_current(self, x: float, y: float, angle: float) -> None:
+        """
+        Update pose current from its coordinates.
         """
-        Update pose current from model.
+        if self.pose_current == (x, y, angle):
+            return
+        self.pose_current = (x, y, angle)
+        self.root.setProperty("x", x)
+        self.root.setProperty("y", y)
+        self.euler_rotation.setZ(angle)
+        self.root.setProperty("eulerRotation", self.euler_rotation)
+
+    def update_lidar_distances(self) -> None:
         """
-        self.root.setProperty("x", pose_current.x)
-        self.root.setProperty("y", pose_current.y)
-        self.root.setProperty("eulerRotation", QVector3D(0, 0, pose_current.O))
+        Copy the distances of all lidar ray nodes to shared memory.
 
-    def handle_distance_changed(self, index: int) -> None:
-        q_object = self.lidar_ray_nodes.get(index)
-        if not q_object:
+        Distances are gathered by the view in the same order as `lidarRayNodes`.
+        """
+        distances = np.asarray(self.view.property("lidarRayDistances"), dtype=np.float64)
+        if distances.shape != self.lidar_ray_angles.shape:
             return
-        distance = q_object.property("distance")
-        if abs(distance - self.shm.shared_lidar_data[index][1]) < 1.0:
+        changed = np.abs(distances - self.shm.shared_lidar_data[self.lidar_ray_angles, 1]) >= 1.0
+        if not changed.any():
             return
         self.lidar_distances_changed = True
-        self.shm.shared_lidar_data[index][1] = distance
+        # Single write lock acquisition for the whole frame
+        self.shm.shared_lidar_data_lock.start_writing()
+        self.shm.shared_lidar_data[self.lidar_ray_angles[changed], 1] = distances[changed]
+        self.shm.shared_lidar_data_lock.finish_writing()
 
     def post_lidar_update(self) -> None:
         """
         Post lidar update to shared memory if distances have changed.
         """
+        self.update_lidar_distances()
         if self.lidar_distances_changed:
             self.lidar_distances_changed = False
             self.shm.shared_lidar_data_lock.post_update()
@@ -3,6 +3,8 @@ from PySide6.QtGui import QColor
 
 
 class RobotManual:
+    base_color = QColor(102, 179, 255, 150)  # RGBA: light blue
+
     def __init__(self, root: QObject):
         self.root = root
 
@@ -10,7 +12,7 @@ class RobotManual:
             m for m in self.root.children() if m.metaObject().className() == "QQuick3DPrincipledMaterial"
         ]
         for mat in principled_materials:
-            mat.setProperty("baseColor", QColor(102, 179, 255, 150))  # RGBA: light blue
+            mat.setProperty("baseColor", RobotManual.base_color)
 
         self.node = self.root.findChild(QObject, "Robot")
         self.models = [m for m in self.node.children() if m.metaObject().className() == "QQuick3DModel"]
@@ -5,15 +5,19 @@ from cogip.models import models
 
 
 class RobotOrder:
+    base_color = QColor(144, 238, 144, 150)  # RGBA: light green
+
     def __init__(self, root: QObject, robot_id: int):
         self.root = root
         self.robot_id = robot_id
+        self.euler_rotation = QVector3D(0, 0, 0)
+        self.pose_order: tuple[float, float, float] | None = None
 
         principled_materials = [
             m for m in self.root.children() if m.metaObject().className() == "QQuick3DPrincipledMaterial"
         ]
         for mat in principled_materials:
-            mat.setProperty("baseColor", QColor(144, 238, 144, 150))  # RGBA: light green
+            mat.setProperty("baseColor", RobotOrder.base_color)
 
         self.node = self.root.findChild(QObject, "Robot")
         self.models = [m for m in self.node.children() if m.metaObject().className() == "QQuick3DModel"]
@@ -24,6 +28,10 @@ class RobotOrder:
         """
         Update pose order.
         """
+        if self.pose_order == (order.x, order.y, order.O):
+            return
+        self.pose_order = (order.x, order.y, order.O)
         self.root.setProperty("x", order.x)
         self.root.setProperty("y", order.y)
-        self.root.setProperty("eulerRotation", QVector3D(0, 0, order.O))
+        self.euler_rotation.setZ(order.O)
+        self.root.setProperty("eulerRotation", self.euler_rotation)
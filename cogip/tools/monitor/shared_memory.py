@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import Any
 
 from numpy.typing import NDArray
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject
 from shiboken6 import Shiboken
 
 from cogip.cpp.libraries.models import CircleList as SharedCircleList
@@ -36,7 +36,6 @@ class SharedMemoryManager(metaclass=Singleton):
         self.shared_sim_camera_data: NDArray | None = None
         self.shared_sim_camera_data_lock: WritePriorityLock | None = None
         self.shared_properties: SharedProperties | None = None
-        self.update_obstacles_timer: QTimer | None = None
         self.view_item: QObject | None = None
         self.scene_root: QObject | None = None
 
@@ -62,18 +61,8 @@ class SharedMemoryManager(metaclass=Singleton):
             self.shared_sim_camera_data = self.shared_memory.get_sim_camera_data()
             self.shared_sim_camera_data_lock = self.shared_memory.get_lock(LockName.SimCameraData)
             self.shared_properties = self.shared_memory.get_properties()
-            if self.update_obstacles_timer is None:
-                self.update_obstacles_timer = QTimer()
-                self.update_obstacles_timer.setInterval(100)
-                self.update_obstacles_timer.timeout.connect(self.update_obstacles)
-            else:
-                self.update_obstacles_timer.stop()
-                self.update_obstacles_timer.setInterval(100)
-            self.update_obstacles_timer.start()
-            self.update_obstacles()
+            self.update_obstacles(force=True)
         else:
-            if self.update_obstacles_timer is not None:
-                self.update_obstacles_timer.stop()
             self.apply_obstacle_data([], [])
 
         if virtual_detector:
@@ -97,16 +86,25 @@ class SharedMemoryManager(metaclass=Singleton):
         self.shared_pose_current_buffer = None
         self.shared_memory = None
         self.robot_id = None
-        if self.update_obstacles_timer is not None:
-            self.update_obstacles_timer.stop()
-            self.update_obstacles_timer.deleteLater()
-            self.update_obstacles_timer = None
         self.apply_obstacle_data([], [])
 
-    def update_obstacles(self) -> None:
+    def update_obstacles(self, force: bool = False) -> None:
+        """
+        Send obstacles from shared memory to the scene.
+
+        Arguments:
+            force: send obstacles even if the planner did not signal an update since last call
+        """
         if self.shared_obstacles_lock is None:
             return
 
+        # Drain pending update signals, skip the refresh if obstacles did not change
+        updated = False
+        while self.shared_obstacles_lock.wait_update(0):
+            updated = True
+        if not updated and not force:
+            return
+
         rectangles: list[dict[str, float]] = []
         circles: list[dict[str, float]] = []
 
@@ -122,9 +120,7 @@ class SharedMemoryManager(metaclass=Singleton):
                         "length_x": rectangle_obstacle.length_x,
                         "length_y": rectangle_obstacle.length_y,
                     }
-                    rect_data["bounding_box"] = [
-                        {"x": vertex.x, "y": vertex.y} for vertex in rectangle_obstacle.bounding_box
-                    ]
+                    rect_data["bounding_box"] = [[vertex.x, vertex.y] for vertex in rectangle_obstacle.bounding_box]
                     rectangles.append(rect_data)
 
             if self.shared_circle_obstacles is not None:
@@ -136,9 +132,7 @@ class SharedMemoryManager(metaclass=Singleton):
                         "angle": center.angle,
                         "radius": circle_obstacle.radius,
                     }
-                    circle_data["bounding_box"] = [
-                        {"x": vertex.x, "y": vertex.y} for vertex in circle_obstacle.bounding_box
-                    ]
+                    circle_data["bounding_box"] = [[vertex.x, vertex.y] for vertex in circle_obstacle.bounding_box]
                     circles.append(circle_data)
         finally:
             self.shared_obstacles_lock.finish_reading()
@@ -33,7 +33,7 @@ class SocketioClient(QtCore.QObject):
         signal_del_robot:
             Qt signal emitted to remove a robot
         signal_pose_current:
-            Qt signal emitted on pose current update
+            Qt signal emitted on pose current update, with x, y and O as arguments
         signal_robot_path:
             Qt signal emitted on robot path update
         signal_tool_menu:
@@ -56,7 +56,7 @@ class SocketioClient(QtCore.QObject):
     signal_exit: QtSignal = QtSignal()
     signal_add_robot: QtSignal = QtSignal(int, bool, bool)
     signal_del_robot: QtSignal = QtSignal(int)
-    signal_pose_current: QtSignal = QtSignal(models.Pose)
+    signal_pose_current: QtSignal = QtSignal(float, float, float)
     signal_robot_path: QtSignal = QtSignal(list)
     signal_tool_menu: QtSignal = QtSignal(models.ShellMenu)
     signal_config_request: QtSignal = QtSignal(dict)
@@ -235,9 +235,8 @@ class SocketioClient(QtCore.QObject):
             Callback on pose current message.
             """
             try:
-                pose_current = models.Pose(**data)
-                self.signal_pose_current.emit(pose_current)
-            except ValidationError as exc:
+                self.signal_pose_current.emit(float(data["x"]), float(data["y"]), float(data["O"]))
+            except (KeyError, TypeError, ValueError) as exc:
                 logger.warning("Failed to decode pose current: %s", exc)
 
         @self.sio.on("path", namespace="/dashboard")
@@ -25,7 +25,8 @@ QML_IMPORT_MAJOR_VERSION = 1
 
 
 class View3DBackend(QObject):
-    sim_camera_update_interval_ms = 50  # 20 FPS
+    update_interval_ms = 50  # 20 FPS, sim camera refresh rate
+    shared_memory_update_ticks = 2  # 100 ms, robot pose and obstacles refresh rate
     robotIdChanged = QtSignal()
 
     def __init__(self, root: QObject):
@@ -36,9 +37,12 @@ class View3DBackend(QObject):
         self.virtual_detector: bool | None = None
         self.view_item = self.root.findChild(QObject, "view") if self.root else None
         self.pip_view = self.root.findChild(QObject, "pipView") if self.root else None
-        self.sim_camera_timer = QTimer()
-        self.sim_camera_timer.setInterval(self.sim_camera_update_interval_ms)
-        self.sim_camera_timer.timeout.connect(self.update_sim_camera)
+        self.update_tick = 0
+        self.update_timer = QTimer()
+        self.update_timer.setInterval(self.update_interval_ms)
+        self.update_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.update_timer.setSingleShot(False)
+        self.update_timer.timeout.connect(self.update_periodic, Qt.ConnectionType.DirectConnection)
         self.shm = SharedMemoryManager()
         self.shm.set_scene(self.root, self.view_item)
         self.robot_manual = RobotManual(self.view_item.findChild(QObject, "robotManual"))
@@ -62,6 +66,19 @@ class View3DBackend(QObject):
     def robotId(self) -> int:
         return self._robot_id if self._robot_id is not None else -1
 
+    @QtSlot()
+    def update_periodic(self):
+        """
+        Single timer callback driving all periodic updates from shared memory.
+        """
+        self.update_sim_camera()
+        self.update_tick += 1
+        if self.update_tick % self.shared_memory_update_ticks:
+            return
+        self.shm.update_obstacles()
+        if self.live_robot and self.live_robot.root.property("visible"):
+            self.live_robot.update_pose_current_from_shm()
+
     def update_sim_camera(self):
         if not self.pip_view or self._robot_id is None:
             return
@@ -124,8 +141,11 @@ class View3DBackend(QObject):
             Qt.ConnectionType.QueuedConnection,
             Q_ARG("QVariant", int(robot_id)),
         )
-        if self.pip_view and virtual_planner:
-            self.sim_camera_timer.start()
+        if virtual_planner:
+            self.update_tick = 0
+            self.update_timer.start()
+        else:
+            self.update_timer.stop()
 
     def handle_del_robot(self, robot_id: int) -> None:
         if not self.view_item:
@@ -134,7 +154,7 @@ class View3DBackend(QObject):
         self._robot_id = None
         self.robotIdChanged.emit()
         logger.info("Removing robot %s", robot_id)
-        self.sim_camera_timer.stop()
+        self.update_timer.stop()
         QMetaObject.invokeMethod(
             self.view_item,
             "removeRobotInstance",
@@ -161,9 +181,9 @@ class View3DBackend(QObject):
         #     self.root.setProperty("rectangleObstacles", [])
         #     self.root.setProperty("circleObstacles", [])
 
-    def handle_pose_current(self, pose_current: models.Pose) -> None:
+    def handle_pose_current(self, x: float, y: float, angle: float) -> None:
         if self.live_robot and not self.virtual_planner:
-            self.live_robot.update_pose_current_from_model(pose_current)
+            self.live_robot.update_pose_current(x, y, angle)
 
     def handle_robot_path(self, path: list[models.Pose]) -> None:
         if len(path) <= 1:
@@ -119,10 +119,10 @@ def avoidance_process(robot_id: int):
                 logger.info("Avoidance: compute path")
                 path = avoidance.get_path(pose_current, pose_order)
         else:
-            if any([obstacle.is_point_inside(pose_current.x, pose_current.y) for obstacle in dyn_obstacles]):
+            if any(obstacle.is_point_inside(pose_current.x, pose_current.y) for obstacle in dyn_obstacles):
                 logger.info("Avoidance: pose current in obstacle")
                 path = []
-            elif any([obstacle.is_point_inside(pose_order.x, pose_order.y) for obstacle in dyn_obstacles]):
+            elif any(obstacle.is_point_inside(pose_order.x, pose_order.y) for obstacle in dyn_obstacles):
                 logger.info("Avoidance: pose order in obstacle")
                 path = []
             else:
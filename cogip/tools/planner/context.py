@@ -14,7 +14,10 @@ from cogip.models.artifacts import (
     PantryID,
     collection_areas,
     pantries,
+    yellow_collection_areas,
+    yellow_pantries,
 )
+from cogip.tools.planner.camp import Camp
 from cogip.tools.planner.pose import AdaptedPose
 from cogip.tools.planner.table import TableEnum
 
@@ -74,51 +77,38 @@ class GameContext:
         new_ctx.back_crates = self.back_crates.copy()
         new_ctx.countdown = self.countdown
         new_ctx.last_countdown = self.last_countdown
-        new_ctx.fixed_obstacles = {k: v.model_copy() for k, v in self.fixed_obstacles.items()}
+        new_ctx.fixed_obstacles = self.fixed_obstacles.copy()
         new_ctx.collection_areas = {k: v.model_copy() for k, v in self.collection_areas.items()}
         new_ctx.pantries = {k: v.model_copy() for k, v in self.pantries.items()}
         return new_ctx
 
     def create_artifacts(self):
+        # Positions are already mirrored for the yellow camp
+        if Camp().color == Camp.Colors.blue:
+            collection_area_positions, pantry_positions = collection_areas, pantries
+        else:
+            collection_area_positions, pantry_positions = yellow_collection_areas, yellow_pantries
+        table = self.shared_properties.table
+
         self.collection_areas = {}
-        for collection_area_id, values in collection_areas.items():
-            x, y, angle, training = values
-            enabled = self.shared_properties.table == TableEnum.Game or (
-                self.shared_properties.table == TableEnum.Training and training
+        for collection_area_id, (x, y, angle, training) in collection_area_positions.items():
+            self.collection_areas[collection_area_id] = CollectionArea(
+                x=x,
+                y=y,
+                O=0.0 if angle is None else angle,
+                id=collection_area_id,
+                enabled=table == TableEnum.Game or (table == TableEnum.Training and training),
             )
-            pose = AdaptedPose(x=x, y=y, O=angle)
-            if angle is None:
-                self.collection_areas[collection_area_id] = CollectionArea(
-                    **pose.model_dump(include={"x", "y"}),
-                    id=collection_area_id,
-                    enabled=enabled,
-                )
-            else:
-                self.collection_areas[collection_area_id] = CollectionArea(
-                    **pose.model_dump(include={"x", "y", "O"}),
-                    id=collection_area_id,
-                    enabled=enabled,
-                )
 
         self.pantries = {}
-        for pantry_id, values in pantries.items():
-            x, y, angle, training = values
-            enabled = self.shared_properties.table == TableEnum.Game or (
-                self.shared_properties.table == TableEnum.Training and training
+        for pantry_id, (x, y, angle, training) in pantry_positions.items():
+            self.pantries[pantry_id] = Pantry(
+                x=x,
+                y=y,
+                O=0.0 if angle is None else angle,
+                id=pantry_id,
+                enabled=table == TableEnum.Game or (table == TableEnum.Training and training),
             )
-            pose = AdaptedPose(x=x, y=y, O=angle)
-            if angle is None:
-                self.pantries[pantry_id] = Pantry(
-                    **pose.model_dump(include={"x", "y"}),
-                    id=pantry_id,
-                    enabled=enabled,
-                )
-            else:
-                self.pantries[pantry_id] = Pantry(
-                    **pose.model_dump(include={"x", "y", "O"}),
-                    id=pantry_id,
-                    enabled=enabled,
-                )
 
         # We can consider that these pantries won't be used by the opponent robot
         if self.shared_properties.robot_id == 1:
@@ -304,8 +304,8 @@ class Planner:
         """
         Get the current pose of the robot.
         """
-        pose = self.shared_pose_current_buffer.last
-        return models.Pose(x=pose.x, y=pose.y, O=pose.angle)
+        # Values come from the shared pose buffer as floats, skip validation
+        return models.Pose.make(*self.shared_pose_current_buffer.last_xyo())
 
     async def start(self):
         """
@@ -554,6 +554,8 @@ class Planner:
             shared_lock.finish_reading()
 
             if not self.shared_properties.disable_fixed_obstacles:
+                # Read once, shared properties are accessed through shared memory
+                robot_width = self.shared_properties.robot_width
                 if self.robot_id == 1:
                     # Add artifact obstacles
                     for collection_area in self.game_context.collection_areas.values():
@@ -565,8 +567,8 @@ class Planner:
                             x=collection_area.x,
                             y=collection_area.y,
                             angle=collection_area.O,
-                            length_x=collection_area.length + self.shared_properties.robot_width,
-                            length_y=collection_area.width + self.shared_properties.robot_width,
+                            length_x=collection_area.length + robot_width,
+                            length_y=collection_area.width + robot_width,
                             bounding_box_margin=margin,
                             id=collection_area.id.value,
                         )
@@ -579,8 +581,8 @@ class Planner:
                             x=pantry.x,
                             y=pantry.y,
                             angle=pantry.O,
-                            length_x=pantry.length + self.shared_properties.robot_width,
-                            length_y=pantry.width + self.shared_properties.robot_width,
+                            length_x=pantry.length + robot_width,
+                            length_y=pantry.width + robot_width,
                             bounding_box_margin=margin,
                             id=pantry.id.value,
                         )
@@ -595,8 +597,8 @@ class Planner:
                         x=fixed_obstacle.x,
                         y=fixed_obstacle.y,
                         angle=0,
-                        length_x=fixed_obstacle.width + self.shared_properties.robot_width,
-                        length_y=fixed_obstacle.length + self.shared_properties.robot_width,
+                        length_x=fixed_obstacle.width + robot_width,
+                        length_y=fixed_obstacle.length + robot_width,
                         bounding_box_margin=margin,
                         id=fixed_obstacle.id.value,
                     )
@@ -46,7 +46,7 @@ class Pose(PathPose):
         """
         Convert the pose into its parent class.
         """
-        return PathPose(**self.model_dump())
+        return PathPose.model_construct(**{name: getattr(self, name) for name in PathPose.model_fields})
 
 
 class AdaptedPose(Pose):
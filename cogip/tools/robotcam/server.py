@@ -386,7 +386,7 @@ class CameraServer:
 
             self.shared_pose_current_lock.start_reading()
             pose = self.shared_pose_current_buffer.get(0)
-            pose_current = models.Pose(x=pose.x, y=pose.y, O=pose.angle)
+            pose_current = models.Pose.make(pose.x, pose.y, pose.angle)
             self.shared_pose_current_lock.finish_reading()
             logger.info(f"Pose current: x={pose_current.x: 5.2f}, y={pose_current.y: 5.2f}, O={pose_current.O: 3.2f}")
 
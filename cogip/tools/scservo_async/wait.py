@@ -16,15 +16,12 @@ async def wait(
     baud_rate = ctx_dict.get("baud_rate")
 
     async with SCServoDriver(str(port), baud_rate) as driver:
-        tasks = []
-        for id in ids:
-            servo = SCServo(driver, id, endian="big")
-            tasks.append(servo.wait_for_stop(timeout=timeout))
-
-        results = await asyncio.gather(*tasks)
+        # All servos are polled together with one sync read per interval
+        servos = [SCServo(driver, id, endian="big") for id in ids]
+        results = await SCServo.wait_for_stop_all(driver, servos, timeout=timeout)
 
-        for id, res in zip(ids, results):
-            print(f"Servo {id}: {res}")
+        for id in ids:
+            print(f"Servo {id}: {results[id]}")
 
 
 def cmd_wait(
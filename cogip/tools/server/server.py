@@ -138,12 +138,8 @@ class Server:
         )
 
     async def update_dashboard(self):
-        shared_pose_current = Server._shared_pose_current_buffer.last
-        pose_current = {
-            "x": shared_pose_current.x,
-            "y": shared_pose_current.y,
-            "O": shared_pose_current.angle,
-        }
+        x, y, angle = Server._shared_pose_current_buffer.last_xyo()
+        pose_current = {"x": x, "y": y, "O": angle}
         await self.sio.emit("pose_current", (self.context.robot_id, pose_current), namespace="/dashboard")
         obstacles = []
         obstacles += [
@@ -176,8 +172,8 @@ class Server:
         try:
             while True:
                 await asyncio.to_thread(Server._shared_avoidance_path_lock.wait_update)
-                shared_pose_current = Server._shared_pose_current_buffer.last
-                path = [{"x": shared_pose_current.x, "y": shared_pose_current.y, "O": shared_pose_current.angle}]
+                x, y, angle = Server._shared_pose_current_buffer.last_xyo()
+                path = [{"x": x, "y": y, "O": angle}]
                 for pose in Server._shared_avoidance_path:
                     path.append({"x": pose.x, "y": pose.y, "O": pose.angle})
                 if len(path) > 1: